@@ -8,6 +8,7 @@ from alembic import context
 # Import the database configuration and models
 from app.database.config import get_database_url
 from app.database.base import Base
+from app.database.migration_utils import clear_inspector_cache
 
 # Import all models to register them with Base
 # Importing from models package ensures all models are registered with Base.metadata
@@ -31,6 +32,12 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def _on_version_apply(**kwargs) -> None:
+    """Drop cached reflection once a revision has changed the schema."""
+    clear_inspector_cache()
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -61,13 +68,37 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def do_run_migrations(connection) -> None:
+    """Run migrations on an open connection."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        on_version_apply=_on_version_apply,
+    )
+
+    try:
+        with context.begin_transaction():
+            context.run_migrations()
+    finally:
+        clear_inspector_cache()
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
     In this scenario we need to create an Engine
     and associate a connection with the context.
 
+    Callers that run several commands back to back (see
+    app.database.migrate.sync_db) can pass an open connection in
+    config.attributes["connection"] to reuse it instead.
+
     """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -75,12 +106,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
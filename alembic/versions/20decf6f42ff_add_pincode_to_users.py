@@ -9,7 +9,8 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import inspect
+
+from app.database.migration_utils import get_cached_inspector
 
 
 # revision identifiers, used by Alembic.
@@ -21,9 +22,8 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add pincode column to users table if it doesn't exist."""
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [c['name'] for c in inspector.get_columns('users')]
+    inspector = get_cached_inspector()
+    columns = {c['name'] for c in inspector.get_columns('users')}
     
     # Add pincode column if it doesn't exist
     if 'pincode' not in columns:
@@ -32,9 +32,8 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     """Remove pincode column from users table."""
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [c['name'] for c in inspector.get_columns('users')]
+    inspector = get_cached_inspector()
+    columns = {c['name'] for c in inspector.get_columns('users')}
     
     # Remove pincode column if it exists
     if 'pincode' in columns:
@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = '44a45c594b37'
@@ -19,20 +18,12 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_column('users', 'phone')
-    op.drop_column('users', 'topics_of_interest')
-    op.drop_column('users', 'preferred_parties')
-    op.drop_column('users', 'political_interest')
-    op.drop_column('users', 'last_login')
-    # ### end Alembic commands ###
+    # No-op: 73fe438fe608 already drops these users columns (only if they
+    # exist), so repeating the unguarded drops here only failed on fresh
+    # databases.
+    pass
 
 
 def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('users', sa.Column('last_login', postgresql.TIMESTAMP(), autoincrement=False, nullable=True))
-    op.add_column('users', sa.Column('political_interest', sa.VARCHAR(), autoincrement=False, nullable=True))
-    op.add_column('users', sa.Column('preferred_parties', sa.TEXT(), autoincrement=False, nullable=True))
-    op.add_column('users', sa.Column('topics_of_interest', sa.TEXT(), autoincrement=False, nullable=True))
-    op.add_column('users', sa.Column('phone', sa.VARCHAR(), autoincrement=False, nullable=True))
-    # ### end Alembic commands ###
+    # No-op: the columns are restored by 73fe438fe608's downgrade.
+    pass
@@ -20,32 +20,51 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    from sqlalchemy import inspect, text
-    
+    from sqlalchemy import text
+
+    from app.database.migration_utils import (
+        get_cached_inspector,
+        safe_alter_table,
+        safe_create_enum,
+        set_not_null,
+    )
+
     conn = op.get_bind()
-    inspector = inspect(conn)
+    inspector = get_cached_inspector()
     
     # Add constituencies.type column (nullable first, then set default, then make NOT NULL)
-    constituencies_columns = [c['name'] for c in inspector.get_columns('constituencies')]
+    constituencies_columns = {c['name'] for c in inspector.get_columns('constituencies')}
     if 'type' not in constituencies_columns:
+        # The enum type only exists on PostgreSQL; this is a no-op elsewhere
+        safe_create_enum('constituency_type', ['VS', 'LS'])
         # First add as nullable
         op.add_column('constituencies', sa.Column('type', sa.Enum('VS', 'LS', name='constituency_type'), nullable=True))
         # Set default value for existing rows (assuming LS for Lok Sabha)
         conn.execute(text("UPDATE constituencies SET type = 'LS' WHERE type IS NULL"))
-        # Now make it NOT NULL
-        op.alter_column('constituencies', 'type', nullable=False)
+        # Now make it NOT NULL (validated via a NOT VALID check on PostgreSQL)
+        set_not_null('constituencies', 'type')
     
-    # Add users columns if they don't exist
-    users_columns = [c['name'] for c in inspector.get_columns('users')]
-    
-    if 'pincode' not in users_columns:
-        op.add_column('users', sa.Column('pincode', sa.String(), nullable=True))
-    if 'vs_constituency_id' not in users_columns:
-        op.add_column('users', sa.Column('vs_constituency_id', sa.String(), nullable=True))
-    if 'ls_constituency_id' not in users_columns:
-        op.add_column('users', sa.Column('ls_constituency_id', sa.String(), nullable=True))
-    if 'political_ideology' not in users_columns:
-        op.add_column('users', sa.Column('political_ideology', sa.String(), nullable=True))
+    # Add the new users columns and remove the ones that were never actually
+    # in the model (just referenced in methods), skipping any already handled,
+    # in a single ALTER TABLE on PostgreSQL
+    users_columns = {c['name'] for c in inspector.get_columns('users')}
+    safe_alter_table(
+        'users',
+        add=[
+            sa.Column('pincode', sa.String(), nullable=True),
+            sa.Column('vs_constituency_id', sa.String(), nullable=True),
+            sa.Column('ls_constituency_id', sa.String(), nullable=True),
+            sa.Column('political_ideology', sa.String(), nullable=True),
+        ],
+        drop=[
+            'political_interest',
+            'phone',
+            'last_login',
+            'preferred_parties',
+            'topics_of_interest',
+        ],
+        cached_columns=users_columns,
+    )
     
     # Add foreign keys if they don't exist
     foreign_keys = inspector.get_foreign_keys('users')
@@ -55,23 +74,13 @@ def upgrade() -> None:
         op.create_foreign_key('fk_users_ls_constituency', 'users', 'constituencies', ['ls_constituency_id'], ['id'])
     if 'vs_constituency_id' not in fk_columns:
         op.create_foreign_key('fk_users_vs_constituency', 'users', 'constituencies', ['vs_constituency_id'], ['id'])
-    
-    # Remove columns only if they exist (these were never actually in the model, just referenced in methods)
-    if 'political_interest' in users_columns:
-        op.drop_column('users', 'political_interest')
-    if 'phone' in users_columns:
-        op.drop_column('users', 'phone')
-    if 'last_login' in users_columns:
-        op.drop_column('users', 'last_login')
-    if 'preferred_parties' in users_columns:
-        op.drop_column('users', 'preferred_parties')
-    if 'topics_of_interest' in users_columns:
-        op.drop_column('users', 'topics_of_interest')
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
+    from app.database.migration_utils import safe_drop_enum
+
     op.add_column('users', sa.Column('topics_of_interest', sa.TEXT(), autoincrement=False, nullable=True))
     op.add_column('users', sa.Column('preferred_parties', sa.TEXT(), autoincrement=False, nullable=True))
     op.add_column('users', sa.Column('last_login', postgresql.TIMESTAMP(), autoincrement=False, nullable=True))
@@ -84,4 +93,5 @@ def downgrade() -> None:
     op.drop_column('users', 'vs_constituency_id')
     op.drop_column('users', 'pincode')
     op.drop_column('constituencies', 'type')
+    safe_drop_enum('constituency_type')
     # ### end Alembic commands ###
@@ -7,7 +7,8 @@ Create Date: 2025-11-21 10:00:00.000000
 """
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import inspect
+
+from app.database.migration_utils import safe_add_columns, safe_alter_table
 
 
 # revision identifiers, used by Alembic.
@@ -18,23 +19,18 @@ depends_on = None
 
 
 def upgrade() -> None:
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [c['name'] for c in inspector.get_columns('candidates')]
-
-    # Add new columns to candidates table if they don't exist
-    if 'political_background' not in columns:
-        op.add_column('candidates', sa.Column('political_background', sa.JSON(), nullable=True))
-    
-    if 'liabilities' not in columns:
-        op.add_column('candidates', sa.Column('liabilities', sa.JSON(), nullable=True))
-        
-    if 'crime_cases' not in columns:
-        op.add_column('candidates', sa.Column('crime_cases', sa.JSON(), nullable=True))
+    # Add new columns to candidates table if they don't exist, in a single
+    # ALTER TABLE on PostgreSQL
+    safe_add_columns('candidates', [
+        sa.Column('political_background', sa.JSON(), nullable=True),
+        sa.Column('liabilities', sa.JSON(), nullable=True),
+        sa.Column('crime_cases', sa.JSON(), nullable=True),
+    ])
 
 
 def downgrade() -> None:
-    # Remove columns from candidates table
-    op.drop_column('candidates', 'crime_cases')
-    op.drop_column('candidates', 'liabilities')
-    op.drop_column('candidates', 'political_background')
+    # Remove columns from candidates table in a single ALTER TABLE
+    safe_alter_table(
+        'candidates',
+        drop=['crime_cases', 'liabilities', 'political_background'],
+    )
@@ -10,7 +10,8 @@ from datetime import datetime
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import inspect
+
+from app.database.migration_utils import safe_add_columns, safe_alter_table
 
 
 # revision identifiers, used by Alembic.
@@ -22,44 +23,28 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add created_at and updated_at columns to candidates table."""
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [c['name'] for c in inspector.get_columns('candidates')]
-    
-    # Add created_at column if it doesn't exist
-    if 'created_at' not in columns:
-        op.add_column(
-            'candidates',
-            sa.Column('created_at', sa.DateTime(), nullable=True)
-        )
-        # Set default value for existing rows
-        op.execute("UPDATE candidates SET created_at = NOW() WHERE created_at IS NULL")
-        # Make the column non-nullable after setting defaults
-        op.alter_column('candidates', 'created_at', nullable=False)
-    
-    # Add updated_at column if it doesn't exist
-    if 'updated_at' not in columns:
-        op.add_column(
-            'candidates',
-            sa.Column('updated_at', sa.DateTime(), nullable=True)
+    # Add both columns as NOT NULL with a CURRENT_TIMESTAMP default in one
+    # statement. NOW() is stable, so PostgreSQL 11+ stores the default in the
+    # catalog instead of rewriting the table, and existing rows read it back
+    # without a separate UPDATE + ALTER COLUMN ... NOT NULL scan.
+    added = safe_add_columns('candidates', [
+        sa.Column(
+            column_name,
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text('CURRENT_TIMESTAMP'),
         )
-        # Set default value for existing rows
-        op.execute("UPDATE candidates SET updated_at = NOW() WHERE updated_at IS NULL")
-        # Make the column non-nullable after setting defaults
-        op.alter_column('candidates', 'updated_at', nullable=False)
+        for column_name in ('created_at', 'updated_at')
+    ])
+
+    # The model sets these in Python, so drop the server default again
+    # (also a catalog-only change)
+    for column_name in added:
+        op.alter_column('candidates', column_name, server_default=None)
 
 
 def downgrade() -> None:
     """Remove created_at and updated_at columns from candidates table."""
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [c['name'] for c in inspector.get_columns('candidates')]
-    
-    # Remove updated_at column if it exists
-    if 'updated_at' in columns:
-        op.drop_column('candidates', 'updated_at')
-    
-    # Remove created_at column if it exists
-    if 'created_at' in columns:
-        op.drop_column('candidates', 'created_at')
+    # Remove both columns (those that exist) in a single ALTER TABLE
+    safe_alter_table('candidates', drop=['updated_at', 'created_at'])
 
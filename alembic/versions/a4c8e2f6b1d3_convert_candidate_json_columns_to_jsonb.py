@@ -0,0 +1,69 @@
+"""convert candidate json columns to jsonb
+
+Revision ID: a4c8e2f6b1d3
+Revises: f6b2d9e4a1c8
+Create Date: 2025-11-26 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.database.migration_utils import get_cached_inspector, table_exists
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f6b1d3'
+down_revision: Union[str, None] = 'f6b2d9e4a1c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = (
+    'education_background',
+    'political_background',
+    'family_background',
+    'assets',
+    'liabilities',
+    'crime_cases',
+)
+
+
+def _columns_by_jsonb(is_jsonb: bool) -> list:
+    """Names of the JSON_COLUMNS whose current type is (or is not) jsonb."""
+    types = {
+        col['name']: col['type']
+        for col in get_cached_inspector().get_columns('candidates')
+    }
+    return [
+        name
+        for name in JSON_COLUMNS
+        if name in types and isinstance(types[name], JSONB) == is_jsonb
+    ]
+
+
+def _alter_types(columns: list, type_name: str) -> None:
+    """Retype all columns in one ALTER TABLE, so the table is rewritten once."""
+    if not columns:
+        return
+    clauses = ', '.join(
+        f'ALTER COLUMN {name} TYPE {type_name} USING {name}::{type_name}'
+        for name in columns
+    )
+    op.execute(f'ALTER TABLE candidates {clauses}')
+
+
+def upgrade() -> None:
+    """Store candidate detail columns as jsonb (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql' or not table_exists('candidates'):
+        return
+
+    _alter_types(_columns_by_jsonb(False), 'jsonb')
+
+
+def downgrade() -> None:
+    """Store candidate detail columns as plain json again."""
+    if op.get_bind().dialect.name != 'postgresql' or not table_exists('candidates'):
+        return
+
+    _alter_types(_columns_by_jsonb(True), 'json')
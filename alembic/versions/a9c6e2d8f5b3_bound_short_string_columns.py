@@ -0,0 +1,72 @@
+"""bound short string columns with varchar(n)
+
+Revision ID: a9c6e2d8f5b3
+Revises: f3b8d6a2c4e7
+Create Date: 2025-11-27 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c6e2d8f5b3'
+down_revision: Union[str, None] = 'f3b8d6a2c4e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> {column: max length}; existing longer values abort the upgrade
+BOUNDED_COLUMNS = {
+    'candidates': {'state_id': 8},
+    'constituencies': {'state_id': 8},
+    'parties': {'short_name': 32},
+    'users': {'pincode': 10, 'age_group': 16},
+}
+
+
+def upgrade() -> None:
+    """
+    Change the bounded columns to varchar(n), one ALTER per table.
+
+    Rows already longer than a bound are reported and the migration fails
+    rather than truncating them; fix those values and re-run.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    overlong = []
+    for table, columns in BOUNDED_COLUMNS.items():
+        for column, length in columns.items():
+            count = bind.execute(
+                sa.text(f'SELECT count(*) FROM {table} WHERE length({column}) > :n'),
+                {'n': length},
+            ).scalar()
+            if count:
+                overlong.append(f'{table}.{column}: {count} longer than {length}')
+    if overlong:
+        raise RuntimeError(
+            'Cannot bound string columns, existing data is too long: '
+            + '; '.join(overlong)
+        )
+
+    for table, columns in BOUNDED_COLUMNS.items():
+        clauses = ', '.join(
+            f'ALTER COLUMN {column} TYPE varchar({length})'
+            for column, length in columns.items()
+        )
+        op.execute(f'ALTER TABLE {table} {clauses}')
+
+
+def downgrade() -> None:
+    """Change the bounded columns back to unbounded varchar."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, columns in BOUNDED_COLUMNS.items():
+        clauses = ', '.join(
+            f'ALTER COLUMN {column} TYPE varchar' for column in columns
+        )
+        op.execute(f'ALTER TABLE {table} {clauses}')
@@ -0,0 +1,50 @@
+"""add covered columns to the users email index
+
+Revision ID: b2d7f4c8e6a1
+Revises: a9c6e2d8f5b3
+Create Date: 2025-11-27 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d7f4c8e6a1'
+down_revision: Union[str, None] = 'a9c6e2d8f5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _swap_email_index(create_sql: str) -> None:
+    """
+    Build the replacement under a temporary name, then drop the old index and
+    take over its name, so email uniqueness is enforced throughout.
+    """
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_new')
+        op.execute(create_sql)
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_users_email')
+        op.execute('ALTER INDEX ix_users_email_new RENAME TO ix_users_email')
+
+
+def upgrade() -> None:
+    """Rebuild the unique email index with INCLUDE (id, name, onboarding_completed)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _swap_email_index(
+        'CREATE UNIQUE INDEX CONCURRENTLY ix_users_email_new ON users (email) '
+        'INCLUDE (id, name, onboarding_completed)'
+    )
+
+
+def downgrade() -> None:
+    """Rebuild the plain unique email index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _swap_email_index(
+        'CREATE UNIQUE INDEX CONCURRENTLY ix_users_email_new ON users (email)'
+    )
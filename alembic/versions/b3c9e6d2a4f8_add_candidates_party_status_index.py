@@ -0,0 +1,36 @@
+"""add candidates party/status index
+
+Revision ID: b3c9e6d2a4f8
+Revises: f2a8d5c1b7e9
+Create Date: 2025-11-26 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c9e6d2a4f8'
+down_revision: Union[str, None] = 'f2a8d5c1b7e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index party-scoped candidate lookups and refresh planner statistics."""
+    safe_create_index(
+        'ix_candidates_party_status',
+        'candidates',
+        ['party_id', 'status'],
+    )
+    # Let the planner see the new indexes without waiting for autovacuum
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ANALYZE candidates')
+
+
+def downgrade() -> None:
+    """Drop the party/status index."""
+    op.execute('DROP INDEX IF EXISTS ix_candidates_party_status')
@@ -0,0 +1,37 @@
+"""make users username index partial
+
+Revision ID: b5d2f7a3c9e1
+Revises: a4c8e2f6b1d3
+Create Date: 2025-11-27 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d2f7a3c9e1'
+down_revision: Union[str, None] = 'a4c8e2f6b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rebuild the unique username index over non-NULL usernames only."""
+    op.execute('DROP INDEX IF EXISTS ix_users_username')
+    safe_create_index(
+        'ix_users_username',
+        'users',
+        ['username'],
+        unique=True,
+        where='username IS NOT NULL',
+    )
+
+
+def downgrade() -> None:
+    """Restore the full unique username index."""
+    op.execute('DROP INDEX IF EXISTS ix_users_username')
+    safe_create_index('ix_users_username', 'users', ['username'], unique=True)
@@ -0,0 +1,61 @@
+"""set candidates timestamps server-side
+
+Revision ID: c4e9a7d3b8f2
+Revises: b2d7f4c8e6a1
+Create Date: 2025-11-27 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.migration_utils import (
+    create_updated_at_trigger,
+    drop_updated_at_trigger,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a7d3b8f2'
+down_revision: Union[str, None] = 'b2d7f4c8e6a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Default candidates.created_at/updated_at to now() and attach the shared
+    set_updated_at() trigger.
+
+    Existing values came from datetime.utcnow() (or CURRENT_TIMESTAMP on a
+    UTC server when the columns were added), so they are read as UTC.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in ('created_at', 'updated_at'):
+        op.alter_column(
+            'candidates',
+            column,
+            type_=sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+    create_updated_at_trigger('candidates')
+
+
+def downgrade() -> None:
+    """Detach the trigger and return to naive UTC timestamps without defaults."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    drop_updated_at_trigger('candidates')
+    for column in ('created_at', 'updated_at'):
+        op.alter_column(
+            'candidates',
+            column,
+            type_=sa.DateTime(),
+            server_default=None,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,57 @@
+"""add election_stats_mv materialized view
+
+Revision ID: c7d1e8f3a5b2
+Revises: b3c9e6d2a4f8
+Create Date: 2025-11-26 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d1e8f3a5b2'
+down_revision: Union[str, None] = 'b3c9e6d2a4f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Candidates are not keyed by election, so every election row carries the
+# same table-wide counts that get_election_statistics has always returned
+CREATE_VIEW = """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS election_stats_mv AS
+    SELECT
+        e.id AS election_id,
+        c.total_candidates,
+        (SELECT COUNT(*) FROM parties) AS total_parties,
+        (SELECT COUNT(*) FROM constituencies) AS total_constituencies,
+        c.total_winners
+    FROM elections e
+    CROSS JOIN (
+        SELECT
+            COUNT(*) AS total_candidates,
+            COUNT(*) FILTER (WHERE status = 'WON') AS total_winners
+        FROM candidates
+    ) c
+"""
+
+
+def upgrade() -> None:
+    """Precompute election statistics (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(CREATE_VIEW)
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        'CREATE UNIQUE INDEX IF NOT EXISTS ix_election_stats_mv_election_id '
+        'ON election_stats_mv (election_id)'
+    )
+
+
+def downgrade() -> None:
+    """Drop the election statistics view."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS election_stats_mv')
@@ -0,0 +1,48 @@
+"""add constituencies state/type covering index
+
+Revision ID: c8e4a1f7d2b5
+Revises: b5d2f7a3c9e1
+Create Date: 2025-11-27 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e4a1f7d2b5'
+down_revision: Union[str, None] = 'b5d2f7a3c9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Index constituencies by (state_id, type), covering the other columns.
+
+    The new index makes ix_constituencies_state_id (its leading column)
+    redundant, so that is dropped. On PostgreSQL both run CONCURRENTLY,
+    outside the migration transaction, so the table stays writable.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        safe_create_index(
+            'ix_constituencies_state_type', 'constituencies', ['state_id', 'type']
+        )
+        op.execute('DROP INDEX IF EXISTS ix_constituencies_state_id')
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_constituencies_state_type '
+            'ON constituencies (state_id, type) INCLUDE (id, original_id, name)'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_constituencies_state_id')
+
+
+def downgrade() -> None:
+    """Restore the single-column state_id index and drop the covering one."""
+    safe_create_index('ix_constituencies_state_id', 'constituencies', ['state_id'])
+    op.execute('DROP INDEX IF EXISTS ix_constituencies_state_type')
@@ -0,0 +1,102 @@
+"""seed elections
+
+Revision ID: d0fce350642d
+Revises: 44a45c594b37
+Create Date: 2025-11-26 09:00:00.000000
+
+"""
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from app.database.migration_utils import table_exists
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0fce350642d'
+down_revision: Union[str, None] = '44a45c594b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ELECTIONS_DIR = Path(__file__).resolve().parents[2] / 'app' / 'data' / 'elections'
+BATCH_SIZE = 1000
+
+# Built once at import time and reused for every batch of rows
+INSERT_ELECTION = sa.text(
+    """
+    INSERT INTO elections (
+        id, name, type, year, total_constituencies,
+        total_candidates, total_parties, result_status
+    )
+    VALUES (
+        :id, :name, :type, :year, :total_constituencies,
+        :total_candidates, :total_parties, :result_status
+    )
+    ON CONFLICT (id) DO NOTHING
+    """
+)
+
+
+def _iter_elections():
+    """Yield election dicts from every seed file, streaming when ijson is available."""
+    for data_path in sorted(ELECTIONS_DIR.glob('*.json')):
+        if ijson is not None:
+            with open(data_path, 'rb') as f:
+                yield from ijson.items(f, 'item')
+        else:
+            with open(data_path, 'r', encoding='utf-8') as f:
+                yield from json.load(f)
+
+
+def _batched(iterable, size):
+    """Yield lists of up to size items (itertools.batched needs Python 3.12)."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _to_row(election):
+    return {
+        'id': election.get('election_id', election.get('id')),
+        'name': election['name'],
+        'type': election['type'],
+        'year': election['year'],
+        'total_constituencies': election.get('total_constituencies'),
+        'total_candidates': election.get('total_candidates'),
+        'total_parties': election.get('total_parties'),
+        'result_status': election.get('result_status'),
+    }
+
+
+def upgrade() -> None:
+    """
+    Seed the elections table from app/data/elections/*.json.
+
+    The seed runs in an autocommit block: the migration transaction is
+    committed first and every batch then commits on its own, so seeded rows
+    are not rolled back atomically with any DDL. Re-running is safe because
+    existing ids are skipped.
+    """
+    if not table_exists('elections'):
+        return
+
+    with op.get_context().autocommit_block():
+        # One executemany per batch instead of a round-trip per election, with
+        # memory bounded by BATCH_SIZE rather than by the size of the seed files
+        connection = op.get_bind()
+        for batch in _batched(_iter_elections(), BATCH_SIZE):
+            connection.execute(INSERT_ELECTION, [_to_row(e) for e in batch])
+
+
+def downgrade() -> None:
+    """Nothing to undo; seeded rows are left in place."""
+    pass
@@ -0,0 +1,29 @@
+"""add parties lower(name) index
+
+Revision ID: d4f9b3e8a6c2
+Revises: c8e4a1f7d2b5
+Create Date: 2025-11-27 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f9b3e8a6c2'
+down_revision: Union[str, None] = 'c8e4a1f7d2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index lower(name) for case-insensitive party name lookups."""
+    safe_create_index('ix_parties_name_lower', 'parties', ['lower(name)'])
+
+
+def downgrade() -> None:
+    """Drop the lower(name) index."""
+    op.execute('DROP INDEX IF EXISTS ix_parties_name_lower')
@@ -0,0 +1,33 @@
+"""add candidates status/id index
+
+Revision ID: d9e3f1a7c2b6
+Revises: c7d1e8f3a5b2
+Create Date: 2025-11-26 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9e3f1a7c2b6'
+down_revision: Union[str, None] = 'c7d1e8f3a5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index candidates by status then ID for keyset-paginated listings."""
+    safe_create_index(
+        'ix_candidates_status_id',
+        'candidates',
+        ['status', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the status/id index."""
+    op.execute('DROP INDEX IF EXISTS ix_candidates_status_id')
@@ -0,0 +1,38 @@
+"""add candidates name trigram index
+
+Revision ID: e1f4a8b2c9d7
+Revises: d9e3f1a7c2b6
+Create Date: 2025-11-26 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f4a8b2c9d7'
+down_revision: Union[str, None] = 'd9e3f1a7c2b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index lower(name) with pg_trgm so substring search avoids a full scan."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    safe_create_index(
+        'ix_candidates_name_trgm',
+        'candidates',
+        ['lower(name) gin_trgm_ops'],
+        using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram index (the pg_trgm extension is left installed)."""
+    op.execute('DROP INDEX IF EXISTS ix_candidates_name_trgm')
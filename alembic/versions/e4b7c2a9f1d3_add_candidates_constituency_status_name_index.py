@@ -0,0 +1,33 @@
+"""add candidates constituency/status/name index
+
+Revision ID: e4b7c2a9f1d3
+Revises: d0fce350642d
+Create Date: 2025-11-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7c2a9f1d3'
+down_revision: Union[str, None] = 'd0fce350642d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index per-constituency candidate listings ordered winners-first by name."""
+    safe_create_index(
+        'ix_candidates_constituency_status_name',
+        'candidates',
+        ['constituency_id', 'status', 'name'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the constituency/status/name index."""
+    op.execute('DROP INDEX IF EXISTS ix_candidates_constituency_status_name')
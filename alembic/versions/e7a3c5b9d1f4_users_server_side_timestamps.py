@@ -0,0 +1,65 @@
+"""set users timestamps server-side
+
+Revision ID: e7a3c5b9d1f4
+Revises: d4f9b3e8a6c2
+Create Date: 2025-11-27 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.migration_utils import (
+    create_updated_at_trigger,
+    drop_updated_at_trigger,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3c5b9d1f4'
+down_revision: Union[str, None] = 'd4f9b3e8a6c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade() -> None:
+    """
+    Default users.created_at/updated_at to now() and maintain updated_at
+    with a BEFORE UPDATE trigger.
+
+    The existing naive values were written with datetime.utcnow(), so they
+    are converted to timestamptz as UTC.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            'users',
+            column,
+            type_=sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+    create_updated_at_trigger('users')
+
+
+def downgrade() -> None:
+    """Drop the trigger and return to naive UTC timestamps without defaults."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    drop_updated_at_trigger('users')
+    # Created by the first create_updated_at_trigger() call in the chain
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
+    for column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            'users',
+            column,
+            type_=sa.DateTime(),
+            server_default=None,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
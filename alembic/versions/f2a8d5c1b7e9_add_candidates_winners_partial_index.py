@@ -0,0 +1,34 @@
+"""add candidates winners partial index
+
+Revision ID: f2a8d5c1b7e9
+Revises: e4b7c2a9f1d3
+Create Date: 2025-11-26 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8d5c1b7e9'
+down_revision: Union[str, None] = 'e4b7c2a9f1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index only winning candidates for winner listings and seat counts."""
+    safe_create_index(
+        'ix_candidates_winners',
+        'candidates',
+        ['party_id', 'id'],
+        where="status = 'WON'",
+    )
+
+
+def downgrade() -> None:
+    """Drop the winners partial index."""
+    op.execute('DROP INDEX IF EXISTS ix_candidates_winners')
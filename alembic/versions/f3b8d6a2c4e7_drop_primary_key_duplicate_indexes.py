@@ -0,0 +1,40 @@
+"""drop indexes duplicating primary keys
+
+Revision ID: f3b8d6a2c4e7
+Revises: e7a3c5b9d1f4
+Create Date: 2025-11-27 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d6a2c4e7'
+down_revision: Union[str, None] = 'e7a3c5b9d1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Plain btree indexes on the id column, which each table's primary key
+# index already covers
+REDUNDANT_INDEXES = {
+    'ix_constituencies_id': 'constituencies',
+    'ix_elections_id': 'elections',
+    'ix_parties_id': 'parties',
+    'ix_users_id': 'users',
+}
+
+
+def upgrade() -> None:
+    """Drop indexes that duplicate the primary key."""
+    for index_name in REDUNDANT_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+def downgrade() -> None:
+    """Recreate the id indexes."""
+    for index_name, table_name in REDUNDANT_INDEXES.items():
+        safe_create_index(index_name, table_name, ['id'])
@@ -0,0 +1,39 @@
+"""drop redundant candidate indexes
+
+Revision ID: f6b2d9e4a1c8
+Revises: e1f4a8b2c9d7
+Create Date: 2025-11-26 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.database.migration_utils import safe_create_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2d9e4a1c8'
+down_revision: Union[str, None] = 'e1f4a8b2c9d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Single-column indexes made redundant by the primary key and by the leading
+# columns of ix_candidates_party_status / ix_candidates_constituency_status_name
+REDUNDANT_INDEXES = {
+    'ix_candidates_id': ['id'],
+    'ix_candidates_party_id': ['party_id'],
+    'ix_candidates_constituency_id': ['constituency_id'],
+}
+
+
+def upgrade() -> None:
+    """Drop indexes that duplicate the primary key or a composite prefix."""
+    for index_name in REDUNDANT_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+def downgrade() -> None:
+    """Recreate the single-column indexes."""
+    for index_name, columns in REDUNDANT_INDEXES.items():
+        safe_create_index(index_name, 'candidates', columns)
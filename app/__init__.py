@@ -14,6 +14,7 @@ load_dotenv()
 
 from app.core.database import init_db
 from app.core.exceptions import RajnitiError
+from app.core.json_provider import OrjsonProvider, orjson
 from app.core.response import error_response
 from app.database.migrate import run_migrations
 
@@ -28,6 +29,10 @@ def create_app():
     app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "dev-secret-key")
     app.config["JSON_SORT_KEYS"] = False
 
+    # Faster JSON serialization when orjson is available
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
     # Enable CORS
     CORS(app)
 
@@ -37,6 +42,7 @@ def create_app():
         logger.info("Database initialized successfully")
         # Run migrations automatically on startup
         run_migrations()
+        _register_db_teardown(app)
     else:
         logger.info("Database not initialized - continuing without database")
 
@@ -58,6 +64,15 @@ def _register_routes(app: Flask) -> None:
     app.register_blueprint(user_bp)
 
 
+def _register_db_teardown(app: Flask) -> None:
+    """Close each request's database session when its app context ends"""
+    from app.database import RequestSession
+
+    @app.teardown_appcontext
+    def remove_db_session(exception=None):
+        RequestSession.remove()
+
+
 def _register_error_handlers(app: Flask) -> None:
     """Register error handlers"""
 
@@ -23,10 +23,7 @@ class CandidateController:
         if not election_id:
             election_id = "lok-sabha-2024"
 
-        results = self.data_service.search_candidates(query, election_id)
-
-        if limit:
-            results = results[:limit]
+        results = self.data_service.search_candidates(query, election_id, limit=limit)
 
         return {
             "query": query,
@@ -43,21 +40,23 @@ class CandidateController:
         if not election:
             return None
 
-        candidates = self.data_service.get_candidates(election_id)
-
-        # Enrich all candidates
-        enriched_candidates = [
-            self.data_service.enrich_candidate_data(candidate, election_id)
-            for candidate in candidates
-        ]
+        # Limit in the data layer so only the returned page is enriched
+        candidates = self.data_service.get_candidates(election_id, limit=limit)
+        total_candidates = (
+            self.data_service.count_candidates(election_id)
+            if limit
+            else len(candidates)
+        )
 
-        if limit:
-            enriched_candidates = enriched_candidates[:limit]
+        # Enrich all candidates with one batched lookup
+        enriched_candidates = self.data_service.enrich_candidates_batch(
+            candidates, election_id
+        )
 
         return {
             "election_id": election_id,
-            "election_name": election.name,
-            "total_candidates": len(candidates),
+            "election_name": election["name"],
+            "total_candidates": total_candidates,
             "showing": len(enriched_candidates),
             "candidates": enriched_candidates,
         }
@@ -90,17 +89,11 @@ class CandidateController:
                 "candidates": [],
             }
 
-        candidates = self.data_service.get_candidates(election_id)
-        results = []
-
-        for candidate in candidates:
-            enriched = self.data_service.enrich_candidate_data(candidate, election_id)
-            # Match by party name or short name
-            if (
-                enriched.get("party_name", "").lower() == party_name.lower()
-                or enriched.get("party_short_name", "").lower() == party_name.lower()
-            ):
-                results.append(enriched)
+        # Match by party name or short name in the data layer
+        results = self.data_service.enrich_candidates_batch(
+            self.data_service.get_candidates_by_party(party_name, election_id),
+            election_id,
+        )
 
         return {
             "party_name": party_name,
@@ -113,37 +106,30 @@ class CandidateController:
         self, constituency_id: str, election_id: str
     ) -> Optional[Dict[str, Any]]:
         """Get all candidates from a specific constituency"""
+        # Existence checks first, so unknown ids never run the candidates query
         election = self.data_service.get_election(election_id)
         if not election:
             return None
-
-        # Get constituency details
         constituency = self.data_service.get_constituency_by_id(
             constituency_id, election_id
         )
         if not constituency:
             return None
 
-        candidates = self.data_service.get_candidates(election_id)
-        constituency_candidates = []
-
-        for candidate in candidates:
-            if candidate.get("constituency_id") == constituency_id:
-                enriched = self.data_service.enrich_candidate_data(
-                    candidate, election_id
-                )
-                constituency_candidates.append(enriched)
+        # Sorted by status (WON first) and then by name in SQL
+        candidates = self.data_service.get_candidates(
+            election_id, constituency_id=constituency_id, winners_first=True
+        )
 
-        # Sort by status (WON first) and then by name
-        constituency_candidates.sort(
-            key=lambda x: (x.get("status") != "WON", x.get("name", ""))
+        constituency_candidates = self.data_service.enrich_candidates_batch(
+            candidates, election_id
         )
 
         return {
             "constituency_id": constituency_id,
-            "constituency_name": constituency.name,
-            "state_id": constituency.state_id,
-            "state_name": self.data_service.get_state_name(constituency.state_id),
+            "constituency_name": constituency["name"],
+            "state_id": constituency["state_id"],
+            "state_name": self.data_service.get_state_name(constituency["state_id"]),
             "election_id": election_id,
             "total_candidates": len(constituency_candidates),
             "candidates": constituency_candidates,
@@ -164,19 +150,14 @@ class CandidateController:
                 "winners": [],
             }
 
-        candidates = self.data_service.get_candidates(election_id)
-        results = []
-
-        for candidate in candidates:
-            if candidate.get("status") == "WON":
-                enriched = self.data_service.enrich_candidate_data(
-                    candidate, election_id
-                )
-                results.append(enriched)
+        results = self.data_service.enrich_candidates_batch(
+            self.data_service.get_candidates(election_id, status="WON"),
+            election_id,
+        )
 
         return {
             "election_id": election_id,
-            "election_name": election.name,
+            "election_name": election["name"],
             "total_winners": len(results),
             "winners": results,
         }
@@ -6,6 +6,8 @@ Handles business logic for constituency-related operations.
 
 from typing import Any, Dict, Optional
 
+from cachetools.func import ttl_cache
+
 from app.services import data_service
 
 
@@ -18,26 +20,30 @@ class ConstituencyController:
     def get_constituencies_by_election(
         self, election_id: str
     ) -> Optional[Dict[str, Any]]:
-        """Get all constituencies for a specific election"""
-        election = self.data_service.get_election(election_id)
-        if not election:
+        """Get all constituencies for a specific election (cached 5 min)"""
+        # Checked outside the cache so an unknown id is not remembered as None
+        if not self.data_service.get_election(election_id):
             return None
+        return self._get_election_constituencies(election_id)
 
+    @ttl_cache(maxsize=64, ttl=300)
+    def _get_election_constituencies(self, election_id: str) -> Dict[str, Any]:
+        """Constituencies of an election known to exist"""
+        # Served from the data service's election cache
+        election = self.data_service.get_election(election_id)
+
+        # Already ordered by state name and then constituency name
         constituencies = self.data_service.get_constituencies(election_id)
 
-        # Enrich with state names
-        constituencies_data = []
-        for const in constituencies:
-            const_dict = const.copy()
-            const_dict["state_name"] = self.data_service.get_state_name(
-                const["state_id"]
-            )
-            constituencies_data.append(const_dict)
-
-        # Sort by state name and then constituency name
-        constituencies_data.sort(
-            key=lambda x: (x.get("state_name", ""), x.get("name", ""))
-        )
+        # Enrich with state names, resolving each distinct state only once
+        state_names = {
+            state_id: self.data_service.get_state_name(state_id)
+            for state_id in {const["state_id"] for const in constituencies}
+        }
+        constituencies_data = [
+            {**const, "state_name": state_names[const["state_id"]]}
+            for const in constituencies
+        ]
 
         return {
             "election_id": election_id,
@@ -56,25 +62,21 @@ class ConstituencyController:
         if not constituency:
             return None
 
-        # Get candidates for this constituency
-        candidates = self.data_service.get_candidates(election_id)
-        constituency_candidates = []
-        winner = None
-
-        for candidate in candidates:
-            if candidate.get("constituency_id") == constituency_id:
-                enriched = self.data_service.enrich_candidate_data(
-                    candidate, election_id
-                )
-                constituency_candidates.append(enriched)
-
-                # Find winner
-                if candidate.get("status") == "WON":
-                    winner = enriched
-
-        # Sort candidates by status (WON first)
-        constituency_candidates.sort(
-            key=lambda x: (x.get("status") != "WON", x.get("name", ""))
+        # Get candidates for this constituency, WON first and then by name,
+        # and enrich them in one batch
+        constituency_candidates = self.data_service.enrich_candidates_batch(
+            self.data_service.get_candidates(
+                election_id, constituency_id=constituency_id, winners_first=True
+            ),
+            election_id,
+        )
+
+        # Winners are ordered first, so only the first candidate needs checking
+        winner = (
+            constituency_candidates[0]
+            if constituency_candidates
+            and constituency_candidates[0].get("status") == "WON"
+            else None
         )
 
         return {
@@ -98,18 +100,19 @@ class ConstituencyController:
         election = self.data_service.get_election("lok-sabha-2024")
         if election:
             constituencies = self.data_service.get_constituencies(election["id"])
-            for const in constituencies:
-                if const["state_id"].upper() == state_code.upper():
-                    const_data = const.copy()
-                    const_data["state_name"] = self.data_service.get_state_name(
-                        const["state_id"]
-                    )
-                    const_data["election_id"] = election["id"]
-                    const_data["election_name"] = election["name"]
-                    results.append(const_data)
-
-        # Sort by constituency name
-        results.sort(key=lambda x: x.get("name", ""))
+            state_code_upper = state_code.upper()
+            state_fields = {
+                "state_name": self.data_service.get_state_name(state_code_upper),
+                "election_id": election["id"],
+                "election_name": election["name"],
+            }
+            results = [
+                {**const, **state_fields}
+                for const in constituencies
+                if const["state_id"].upper() == state_code_upper
+            ]
+
+        # Constituencies of a single state already come back ordered by name
 
         return {
             "state_code": state_code,
@@ -128,17 +131,12 @@ class ConstituencyController:
 
         candidates = constituency_data["all_candidates"]
 
-        # Calculate victory margin (difference between 1st and 2nd)
-        victory_margin = 0
-        if len(candidates) >= 2:
-            # Candidates are already sorted with winner first
-            victory_margin = 0  # Can calculate from vote data if available
-
         return {
             "constituency": constituency_data["constituency"],
             "election_id": election_id,
             "total_candidates": len(candidates),
-            "victory_margin": victory_margin,
+            # Candidates carry no vote counts, so there is no margin to report
+            "victory_margin": 0,
             "winner": constituency_data["winner"],
             "results": candidates,
         }
@@ -6,6 +6,8 @@ Handles business logic for election-related operations.
 
 from typing import Any, Dict, List, Optional
 
+from cachetools.func import ttl_cache
+
 from app.services import data_service
 
 
@@ -15,33 +17,36 @@ class ElectionController:
     def __init__(self):
         self.data_service = data_service
 
+    @ttl_cache(maxsize=1, ttl=300)
     def get_all_elections(self) -> List[Dict[str, Any]]:
-        """Get all elections with basic statistics"""
+        """Get all elections with basic statistics (cached 5 min)"""
         elections = self.data_service.get_elections()
-        result = []
-
-        for election in elections:
-            election_data = election.copy()
-
-            # Use efficient statistics method instead of fetching all data
-            # This uses COUNT queries instead of loading all records
-            stats = self.data_service.get_election_statistics(election["id"])
 
-            election_data["statistics"] = stats
+        # One statistics query for every election instead of one per election
+        stats_by_id = self.data_service.get_election_statistics_bulk(
+            [election["id"] for election in elections]
+        )
 
-            result.append(election_data)
-
-        return result
+        return [
+            {**election, "statistics": stats_by_id[election["id"]]}
+            for election in elections
+        ]
 
     def get_election_by_id(self, election_id: str) -> Optional[Dict[str, Any]]:
-        """Get election details with comprehensive statistics"""
-        election = self.data_service.get_election(election_id)
-        if not election:
+        """Get election details with comprehensive statistics (cached 5 min)"""
+        # Checked outside the cache so an unknown id is not remembered as None
+        if not self.data_service.get_election(election_id):
             return None
+        return self._get_election_details(election_id)
 
-        result = election.copy()
+    @ttl_cache(maxsize=64, ttl=300)
+    def _get_election_details(self, election_id: str) -> Dict[str, Any]:
+        """Details of an election known to exist"""
+        # Served from the data service's election cache
+        result = self.data_service.get_election(election_id).copy()
 
-        # Get basic statistics using efficient COUNT queries
+        # Read from the election_stats_mv materialized view, falling back to
+        # live COUNT queries when it is missing or has no row yet
         stats = self.data_service.get_election_statistics(election_id)
         
         # Get top parties using efficient SQL GROUP BY query
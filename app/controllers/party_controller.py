@@ -4,8 +4,12 @@ Party Controller
 Handles business logic for party-related operations.
 """
 
+from collections import Counter
 from typing import Any, Dict, Optional
 
+import numpy as np
+from cachetools.func import ttl_cache
+
 from app.services import data_service
 
 
@@ -21,25 +25,8 @@ class PartyController:
         if not election:
             return None
 
-        parties = self.data_service.get_parties(election_id)
-        candidates = self.data_service.get_candidates(election_id)
-
-        # Count seats for each party
-        party_seats = {}
-        for candidate in candidates:
-            if candidate.get("status") == "WON":
-                party_id = candidate.get("party_id", "UNKNOWN")
-                party_seats[party_id] = party_seats.get(party_id, 0) + 1
-
-        # Prepare party data with seats
-        parties_data = []
-        for party in parties:
-            party_dict = party.copy()
-            party_dict["seats_won"] = party_seats.get(party["id"], 0)
-            parties_data.append(party_dict)
-
-        # Sort by seats won
-        parties_data.sort(key=lambda x: x["seats_won"], reverse=True)
+        # Seat counts come from a SQL GROUP BY, already sorted by seats won
+        parties_data = self.data_service.get_parties_with_seats(election_id)
 
         return {
             "election_id": election_id,
@@ -56,20 +43,13 @@ class PartyController:
         if not party:
             return None
 
-        # Get all candidates from this party
-        candidates = self.data_service.get_candidates(election_id)
-        party_candidates = []
-        winners = 0
-
-        for candidate in candidates:
-            enriched = self.data_service.enrich_candidate_data(candidate, election_id)
-            if (
-                enriched.get("party_name", "").lower() == party["name"].lower()
-                or enriched.get("party_id") == party["id"]
-            ):
-                party_candidates.append(enriched)
-                if candidate.get("status") == "WON":
-                    winners += 1
+        # Get only this party's candidates (filtered on the indexed party_id),
+        # enriched in one batch
+        party_candidates = self.data_service.enrich_candidates_batch(
+            self.data_service.get_candidates(election_id, party_id=party["id"]),
+            election_id,
+        )
+        winners = sum(1 for c in party_candidates if c.get("status") == "WON")
 
         return {
             "election_id": election_id,
@@ -95,48 +75,42 @@ class PartyController:
         if not party:
             return {"party_name": party_name, "performance": None}
 
-        # Get candidates from this party
-        candidates = self.data_service.get_candidates(election_id)
-        party_candidates = []
-        winners = 0
-        state_wise_performance = {}
-
-        for candidate in candidates:
-            enriched = self.data_service.enrich_candidate_data(candidate, election_id)
-            if (
-                enriched.get("party_name", "").lower() == party["name"].lower()
-                or enriched.get("party_id") == party["id"]
-            ):
-                party_candidates.append(enriched)
-
-                # Count winners
-                if candidate.get("status") == "WON":
-                    winners += 1
-
-                # State-wise performance
-                state_name = enriched.get("state_name", "Unknown")
-                if state_name not in state_wise_performance:
-                    state_wise_performance[state_name] = {
-                        "total_candidates": 0,
-                        "seats_won": 0,
-                    }
-                state_wise_performance[state_name]["total_candidates"] += 1
-                if candidate.get("status") == "WON":
-                    state_wise_performance[state_name]["seats_won"] += 1
+        # State-wise performance, tallied in one pass over streamed candidates
+        # so the party's full candidate list is never held in memory
+        state_candidates = Counter()
+        state_wins = Counter()
+        for candidate in self.data_service.get_candidates_iter(
+            election_id, party_id=party["id"]
+        ):
+            state = candidate.get("state_name", "Unknown")
+            state_candidates[state] += 1
+            if candidate.get("status") == "WON":
+                state_wins[state] += 1
+        total_candidates = sum(state_candidates.values())
+        winners = sum(state_wins.values())
+
+        # Win percentages for every state in one vectorized pass
+        states = list(state_candidates)
+        totals = np.fromiter(state_candidates.values(), dtype=np.int32)
+        wins = np.fromiter((state_wins[s] for s in states), dtype=np.int32)
+        percentages = np.round(
+            np.divide(
+                wins * 100.0, totals, out=np.zeros(len(states)), where=totals > 0
+            ),
+            2,
+        )
 
         # Convert state-wise performance to list
         state_performance = [
             {
                 "state_name": state,
-                "total_candidates": data["total_candidates"],
-                "seats_won": data["seats_won"],
-                "win_percentage": round(
-                    (data["seats_won"] / data["total_candidates"] * 100), 2
-                )
-                if data["total_candidates"] > 0
-                else 0,
+                "total_candidates": total,
+                "seats_won": won,
+                "win_percentage": pct,
             }
-            for state, data in state_wise_performance.items()
+            for state, total, won, pct in zip(
+                states, totals.tolist(), wins.tolist(), percentages.tolist()
+            )
         ]
         # Sort by seats won
         state_performance.sort(key=lambda x: x["seats_won"], reverse=True)
@@ -146,32 +120,26 @@ class PartyController:
             "party_short_name": party["short_name"],
             "election_id": election_id,
             "election_name": election["name"],
-            "total_candidates": len(party_candidates),
+            "total_candidates": total_candidates,
             "seats_won": winners,
-            "win_percentage": round((winners / len(party_candidates) * 100), 2)
-            if party_candidates
+            "win_percentage": round((winners / total_candidates * 100), 2)
+            if total_candidates
             else 0,
             "state_wise_performance": state_performance,
         }
 
+    @ttl_cache(maxsize=1, ttl=300)
     def get_all_parties(self) -> Dict[str, Any]:
-        """Get all parties across all elections"""
+        """Get all parties across all elections (cached 5 min)"""
         all_parties_dict = {}
 
         for election in self.data_service.get_elections():
-            parties = self.data_service.get_parties(election.id)
-            candidates = self.data_service.get_candidates(election.id)
-
-            # Count seats for each party
-            party_seats = {}
-            for candidate in candidates:
-                if candidate.get("status") == "WON":
-                    party_id = candidate.get("party_id", "UNKNOWN")
-                    party_seats[party_id] = party_seats.get(party_id, 0) + 1
+            # Seat counts come from a SQL GROUP BY instead of tallying candidates
+            parties = self.data_service.get_parties_with_seats(election["id"])
 
             for party in parties:
                 party_name = party["name"]
-                seats_won = party_seats.get(party["id"], 0)
+                seats_won = party["seats_won"]
 
                 if party_name not in all_parties_dict:
                     all_parties_dict[party_name] = {
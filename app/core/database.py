@@ -4,11 +4,10 @@ Database configuration for Rajniti application.
 Simple PostgreSQL setup without any schema definitions yet.
 """
 import logging
-import os
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import declarative_base
 
 logger = logging.getLogger(__name__)
 
@@ -31,28 +30,29 @@ def init_db(app=None):
     """
     global engine, SessionLocal
 
-    # Get database URL from environment or config
-    database_url = os.getenv("DATABASE_URL")
+    # Already initialized (repeated create_app() calls, test harnesses):
+    # reuse the existing engine instead of stranding its pool
+    if engine is not None:
+        return True
 
-    if not database_url:
+    # Reuse the models' engine and session factory rather than opening a
+    # second connection pool; importing them raises without DATABASE_URL
+    try:
+        from app.database.session import SessionLocal as models_session
+        from app.database.session import engine as models_engine
+    except ValueError:
         logger.warning("DATABASE_URL not set. Database will not be initialized.")
         return False
 
     try:
-        # Create engine
-        engine = create_engine(
-            database_url,
-            pool_pre_ping=True,  # Verify connections before using
-            echo=False,  # Set to True for SQL query logging
-        )
-
-        # Create session factory
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
         # Test connection
-        with engine.connect() as conn:
+        with models_engine.connect() as conn:
             conn.execute(text("SELECT 1"))
 
+        # Publish the engine and session factory only once the connection works
+        engine = models_engine
+        SessionLocal = models_session
+
         logger.info("Database connection established successfully")
         return True
 
@@ -5,10 +5,30 @@ Logs missing and present environment variables on server startup.
 """
 import logging
 import os
-from typing import Dict, List
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# (name, required, default, description) for each environment variable
+_ENV_SPEC: Tuple[Tuple[str, bool, Optional[str], str], ...] = (
+    # Required/Important variables (no defaults or sensitive defaults)
+    ("DATABASE_URL", False, None, "Database connection string"),
+    ("SECRET_KEY", False, None, "Flask secret key (using default in dev)"),
+    ("PERPLEXITY_API_KEY", False, None, "Perplexity AI API key for search features"),
+    # Optional configuration variables with defaults
+    ("FLASK_ENV", False, "development", "Flask environment"),
+    ("FLASK_HOST", False, "0.0.0.0", "Server host"),
+    ("FLASK_PORT", False, "8000", "Server port"),
+    ("FLASK_DEBUG", False, "True", "Debug mode"),
+    ("DB_ECHO", False, "false", "SQL query logging"),
+    ("DB_POOL_SIZE", False, "20", "Database connection pool size"),
+    ("DB_MAX_OVERFLOW", False, "30", "Extra connections allowed under load"),
+    ("DB_POOL_RECYCLE", False, "1800", "Pooled connection lifetime (s)"),
+    ("DB_POOL_TIMEOUT", False, "10", "Wait for a pooled connection (s)"),
+    ("DB_STATEMENT_TIMEOUT_MS", False, "30000", "Statement timeout, ms (0 = off)"),
+    ("RUN_MIGRATIONS", False, "true", "Run database migrations on startup"),
+)
+
 
 def check_environment_variables() -> None:
     """
@@ -18,78 +38,46 @@ def check_environment_variables() -> None:
     - Missing optional environment variables
     - Present environment variables (without exposing sensitive values)
     """
-    # Define environment variables with their properties
-    env_vars: Dict[str, Dict[str, any]] = {
-        # Required/Important variables (no defaults or sensitive defaults)
-        "DATABASE_URL": {
-            "required": False,
-            "description": "Database connection string",
-        },
-        "SECRET_KEY": {
-            "required": False,
-            "description": "Flask secret key (using default in dev)",
-        },
-        "PERPLEXITY_API_KEY": {
-            "required": False,
-            "description": "Perplexity AI API key for search features",
-        },
-        # Optional configuration variables with defaults
-        "FLASK_ENV": {
-            "required": False,
-            "description": "Flask environment",
-            "default": "development",
-        },
-        "FLASK_HOST": {
-            "required": False,
-            "description": "Server host",
-            "default": "0.0.0.0",
-        },
-        "FLASK_PORT": {
-            "required": False,
-            "description": "Server port",
-            "default": "8000",
-        },
-        "FLASK_DEBUG": {
-            "required": False,
-            "description": "Debug mode",
-            "default": "True",
-        },
-        "DB_ECHO": {
-            "required": False,
-            "description": "SQL query logging",
-            "default": "false",
-        },
-    }
+    if not logger.isEnabledFor(logging.WARNING):
+        return
 
     missing_vars: List[str] = []
     present_vars: List[str] = []
+    status_lines: List[str] = []
+    warning_lines: List[str] = []
 
-    logger.info("=" * 60)
-    logger.info("Environment Variables Check")
-    logger.info("=" * 60)
-
-    for var_name, var_info in env_vars.items():
-        value = os.getenv(var_name)
-
-        if value is None:
+    for var_name, _required, default, description in _ENV_SPEC:
+        if os.getenv(var_name) is None:
             missing_vars.append(var_name)
-            default = var_info.get("default")
             if default:
-                logger.info(
-                    f"❌ {var_name}: Not set (using default: {default}) - "
-                    f"{var_info['description']}"
+                status_lines.append(
+                    f"❌ {var_name}: Not set (using default: {default}) - {description}"
                 )
             else:
-                logger.warning(f"⚠️  {var_name}: Not set - {var_info['description']}")
+                warning_lines.append(f"⚠️  {var_name}: Not set - {description}")
         else:
             present_vars.append(var_name)
             # Don't log the actual value for security
-            logger.info(f"✓ {var_name}: Set - {var_info['description']}")
+            status_lines.append(f"✓ {var_name}: Set - {description}")
+
+    # One record per level instead of one per line
+    if warning_lines:
+        logger.warning("\n".join(warning_lines))
 
-    logger.info("=" * 60)
-    logger.info(f"Summary: {len(present_vars)} set, {len(missing_vars)} missing")
-    logger.info("=" * 60)
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
+    divider = "=" * 60
+    lines = [
+        divider,
+        "Environment Variables Check",
+        divider,
+        *status_lines,
+        divider,
+        f"Summary: {len(present_vars)} set, {len(missing_vars)} missing",
+        divider,
+    ]
     if missing_vars:
-        logger.info("Missing variables: " + ", ".join(missing_vars))
-        logger.info("Tip: Copy .env.example to .env and configure required variables")
+        lines.append("Missing variables: " + ", ".join(missing_vars))
+        lines.append("Tip: Copy .env.example to .env and configure required variables")
+    logger.info("\n".join(lines))
@@ -0,0 +1,34 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Used automatically when orjson is installed; Flask's default provider is kept
+otherwise.
+"""
+
+from typing import Any, Union
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize responses with orjson instead of the stdlib json module"""
+
+    # Keep insertion order, as JSON_SORT_KEYS = False intends
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        # Fall back to Flask's handling for types orjson doesn't know (Decimal, ...)
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
@@ -7,10 +7,11 @@ and Supabase (which uses PostgreSQL).
 
 from .base import Base, get_db_session
 from .config import get_database_url
-from .session import SessionLocal, engine, init_db
+from .session import RequestSession, SessionLocal, engine, init_db
 
 __all__ = [
     "Base",
+    "RequestSession",
     "SessionLocal",
     "engine",
     "init_db",
@@ -3,15 +3,79 @@ Base database model and utilities.
 """
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import FrozenSet, Generator, Iterator, List
 
+from flask import has_app_context
+from sqlalchemy import Table
 from sqlalchemy.orm import DeclarativeBase, Session
 
+# Rows per executemany in the models' bulk_create/bulk_upsert; PostgreSQL
+# gains nothing from larger batches and binding memory grows with them
+BULK_CHUNK_SIZE = 5_000
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
-    pass
+    @classmethod
+    @contextmanager
+    def defer_indexes(cls, session: Session, enabled: bool = True) -> Iterator[None]:
+        """
+        Drop the table's non-unique indexes for a large bulk load.
+
+        Rebuilding an index once after the load is cheaper than maintaining
+        it row by row. The drop and rebuild run in the session's transaction,
+        so a failed load rolls the indexes back too, but DROP INDEX takes an
+        ACCESS EXCLUSIVE lock on the table: every reader of the table blocks
+        until the session commits. Only opt in for offline loads.
+
+        Args:
+            session: Database session
+            enabled: Whether to drop and rebuild; False makes this a no-op
+        """
+        if not enabled:
+            yield
+            return
+
+        connection = session.connection()
+        indexes = [index for index in cls.__table__.indexes if not index.unique]
+        for index in indexes:
+            index.drop(bind=connection, checkfirst=True)
+        yield
+        for index in indexes:
+            index.create(bind=connection)
+
+
+def execute_chunked(
+    session: Session, statement, values: List[dict], chunk_size: int = BULK_CHUNK_SIZE
+) -> None:
+    """
+    Execute statement as an executemany over values, chunk_size rows at a time.
+
+    The models pass INSERT/upsert statements built once at import time. Every
+    call then reuses the same statement object with row dicts of the same
+    keys, so SQLAlchemy compiles it once per process and serves later calls
+    from its compiled-statement cache.
+
+    Args:
+        session: Database session
+        statement: Insert/upsert statement taking one parameter dict per row
+        values: Row parameter dictionaries
+        chunk_size: Maximum rows per execute
+    """
+    with session.no_autoflush:
+        for start in range(0, len(values), chunk_size):
+            session.execute(statement, values[start : start + chunk_size])
+
+
+def mutable_columns(table: Table) -> FrozenSet[str]:
+    """
+    Column attributes a model's update() may assign: every column but "id".
+
+    Computed once per model so update() can filter keywords with a set
+    lookup instead of probing the instance with hasattr().
+    """
+    return frozenset(column.key for column in table.columns if column.key != "id")
 
 
 @contextmanager
@@ -19,16 +83,20 @@ def get_db_session() -> Generator[Session, None, None]:
     """
     Context manager for database sessions.
 
-    Automatically commits on success and rolls back on error.
+    Automatically commits on success and rolls back on error. Inside a
+    Flask application context the request's RequestSession is used and left
+    open for the app's teardown to close; elsewhere (CLI, scripts) a fresh
+    session is closed on exit.
 
     Usage:
         with get_db_session() as session:
             # Use session
             session.add(obj)
     """
-    from .session import SessionLocal
+    from .session import RequestSession, SessionLocal
 
-    session = SessionLocal()
+    in_request = has_app_context()
+    session = RequestSession() if in_request else SessionLocal()
     try:
         yield session
         session.commit()
@@ -36,4 +104,5 @@ def get_db_session() -> Generator[Session, None, None]:
         session.rollback()
         raise
     finally:
-        session.close()
+        if not in_request:
+            session.close()
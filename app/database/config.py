@@ -5,8 +5,14 @@ Supports both local PostgreSQL and Supabase (PostgreSQL-based).
 """
 
 import os
+from functools import cache
+from typing import Any, Dict
 
+from sqlalchemy.engine import make_url
 
+
+# Environment variables don't change at runtime, so both values are read once
+@cache
 def get_database_url() -> str:
     """
     Get database URL from environment variable.
@@ -36,6 +42,7 @@ def get_database_url() -> str:
     return database_url
 
 
+@cache
 def get_echo_mode() -> bool:
     """
     Get SQLAlchemy echo mode from environment.
@@ -44,3 +51,44 @@ def get_echo_mode() -> bool:
         True if SQL queries should be logged, False otherwise
     """
     return os.getenv("DB_ECHO", "false").lower() == "true"
+
+
+@cache
+def get_engine_options() -> Dict[str, Any]:
+    """
+    Get connection pool and connection options for create_engine().
+
+    Environment variables:
+    - DB_POOL_SIZE: Connections kept open in the pool (default 20)
+    - DB_MAX_OVERFLOW: Extra connections allowed under load (default 30)
+    - DB_POOL_RECYCLE: Seconds before a connection is replaced, so server or
+      proxy idle timeouts never hand out a dead socket (default 1800)
+    - DB_POOL_TIMEOUT: Seconds to wait for a free connection (default 10)
+    - DB_STATEMENT_TIMEOUT_MS: PostgreSQL statement_timeout in milliseconds
+      (default 30000; 0 disables it, e.g. behind a pooler that rejects the
+      startup "options" parameter)
+
+    Returns:
+        Keyword arguments for create_engine()
+    """
+    options: Dict[str, Any] = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+    }
+    url = make_url(get_database_url())
+    if url.get_driver_name() == "psycopg2":
+        # INSERT executemany already goes through insertmanyvalues; this adds
+        # psycopg2's execute_batch for UPDATE/DELETE executemany, sending
+        # executemany_batch_page_size statements per round trip instead of one
+        options["executemany_mode"] = "values_plus_batch"
+        options["executemany_batch_page_size"] = 500
+    if url.get_backend_name() == "postgresql":
+        connect_args = {"application_name": "rajniti-api"}
+        statement_timeout = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+        if statement_timeout:
+            # Stop runaway queries from holding a pool slot indefinitely
+            connect_args["options"] = f"-c statement_timeout={statement_timeout}"
+        options["connect_args"] = connect_args
+    return options
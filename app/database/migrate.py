@@ -5,37 +5,95 @@ Runs Alembic migrations automatically to keep database in sync with models.
 """
 import logging
 import os
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, Tuple
 
-from alembic import command
-from alembic.config import Config
+from .config import get_database_url
+from .session import engine
+
+# Alembic (with Mako and its plugin discovery) is imported inside the functions
+# below, so processes that never migrate don't pay for it at startup
+if TYPE_CHECKING:
+    from alembic.config import Config
 
 logger = logging.getLogger(__name__)
 
+ALEMBIC_INI = Path(__file__).parent.parent.parent / "alembic.ini"
+
+# Parsed alembic.ini per (ini path, database URL), reused across calls
+_CONFIG_CACHE: Dict[Tuple[str, str], "Config"] = {}
+
+
+def _get_config(database_url: str) -> "Config":
+    """Get the Alembic Config for database_url, reading alembic.ini only once."""
+    from alembic.config import Config
+
+    key = (str(ALEMBIC_INI), database_url)
+    alembic_cfg = _CONFIG_CACHE.get(key)
+    if alembic_cfg is None:
+        alembic_cfg = Config(str(ALEMBIC_INI))
+        alembic_cfg.set_main_option("sqlalchemy.url", database_url)
+        _CONFIG_CACHE[key] = alembic_cfg
+    return alembic_cfg
+
+
+@contextmanager
+def _shared_connection(alembic_cfg: "Config") -> Iterator[None]:
+    """
+    Run the Alembic commands in this block on one connection from the app's
+    pooled engine; alembic/env.py uses it instead of building its own engine.
+    """
+    with engine.connect() as connection:
+        postgres = connection.dialect.name == "postgresql"
+        if postgres:
+            # Index builds and data migrations may outlast the app's
+            # DB_STATEMENT_TIMEOUT_MS; RESET restores it before the connection
+            # goes back to the pool
+            connection.exec_driver_sql("SET statement_timeout = 0")
+            # Commit so Alembic starts its own transaction on a clean connection
+            connection.commit()
+        alembic_cfg.attributes["connection"] = connection
+        try:
+            yield
+        finally:
+            alembic_cfg.attributes.pop("connection", None)
+            if postgres:
+                connection.rollback()  # no-op unless a migration failed mid-way
+                connection.exec_driver_sql("RESET statement_timeout")
+                connection.commit()
+
 
 def run_migrations() -> bool:
     """
     Run all pending Alembic migrations.
 
+    Set RUN_MIGRATIONS=false to skip this (e.g. in serving workers when a
+    separate release step migrates); Alembic is then never imported.
+
     Returns:
         bool: True if migrations succeeded, False otherwise
     """
+    if os.getenv("RUN_MIGRATIONS", "true").lower() == "false":
+        logger.info("RUN_MIGRATIONS=false. Skipping migrations.")
+        return False
+
     try:
-        # Get the project root directory
-        project_root = Path(__file__).parent.parent.parent
-        alembic_cfg = Config(str(project_root / "alembic.ini"))
+        from alembic import command
 
         # Set the database URL from environment
-        database_url = os.getenv("DATABASE_URL")
-        if not database_url:
+        try:
+            database_url = get_database_url()
+        except ValueError:
             logger.warning("DATABASE_URL not set. Skipping migrations.")
             return False
 
-        alembic_cfg.set_main_option("sqlalchemy.url", database_url)
+        alembic_cfg = _get_config(database_url)
 
         # Run migrations to head
         logger.info("Running database migrations...")
-        command.upgrade(alembic_cfg, "head")
+        with _shared_connection(alembic_cfg):
+            command.upgrade(alembic_cfg, "head")
         logger.info("✓ Database migrations completed successfully")
         return True
 
@@ -54,38 +112,42 @@ def sync_db() -> bool:
     1. Auto-generates a migration from model changes
     2. Runs the migration
 
+    Both steps share one pooled connection instead of each opening its own.
+
     Returns:
         bool: True if sync succeeded, False otherwise
     """
     try:
-        project_root = Path(__file__).parent.parent.parent
-        alembic_cfg = Config(str(project_root / "alembic.ini"))
+        from alembic import command
 
-        database_url = os.getenv("DATABASE_URL")
-        if not database_url:
+        try:
+            database_url = get_database_url()
+        except ValueError:
             logger.warning("DATABASE_URL not set. Skipping DB sync.")
             return False
 
-        alembic_cfg.set_main_option("sqlalchemy.url", database_url)
+        alembic_cfg = _get_config(database_url)
+
+        with _shared_connection(alembic_cfg):
+            # Auto-generate migration (may create empty migration if no changes)
+            logger.info("Auto-generating migration from model changes...")
+            message = "Auto-sync: model changes"
+            try:
+                command.revision(alembic_cfg, autogenerate=True, message=message)
+            except Exception as e:
+                # If autogenerate fails (e.g., no changes detected), that's okay
+                # Just proceed to run existing migrations
+                if "Target database is not up to date" in str(e):
+                    logger.warning(
+                        "Database not up to date. Running existing migrations..."
+                    )
+                else:
+                    logger.debug(f"Autogenerate note: {e}")
+
+            # Run migrations
+            logger.info("Running migrations...")
+            command.upgrade(alembic_cfg, "head")
 
-        # Auto-generate migration (may create empty migration if no changes)
-        logger.info("Auto-generating migration from model changes...")
-        message = "Auto-sync: model changes"
-        try:
-            command.revision(alembic_cfg, autogenerate=True, message=message)
-        except Exception as e:
-            # If autogenerate fails (e.g., no changes detected), that's okay
-            # Just proceed to run existing migrations
-            if "Target database is not up to date" in str(e):
-                logger.warning(
-                    "Database not up to date. Running existing migrations..."
-                )
-            else:
-                logger.debug(f"Autogenerate note: {e}")
-
-        # Run migrations
-        logger.info("Running migrations...")
-        command.upgrade(alembic_cfg, "head")
         logger.info("✓ Database sync completed successfully")
         return True
 
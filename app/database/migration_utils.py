@@ -3,23 +3,66 @@ Idempotent migration utilities.
 
 Provides helper functions to make migrations safe to run multiple times.
 """
+from typing import List, Optional, Sequence, Set, Tuple
+from weakref import WeakKeyDictionary
+
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy import inspect, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.schema import CreateColumn
+
+# One Inspector per migration connection. A fresh Inspector starts with an
+# empty info_cache, so sharing it lets repeated existence checks reuse the
+# reflection results instead of querying the catalog every time. Keyed weakly
+# by the connection itself, so a closed connection's entry goes away with it
+# and a new connection can never pick up a stale Inspector via a reused id().
+_inspector_cache: "WeakKeyDictionary[sa.engine.Connection, Inspector]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_cached_inspector() -> Inspector:
+    """
+    Get the shared Inspector for the current migration connection.
+
+    The cache is cleared by alembic/env.py after each revision is applied, so
+    reflected results never leak across schema changes.
+    """
+    bind = op.get_bind()
+    inspector = _inspector_cache.get(bind)
+    if inspector is None:
+        inspector = inspect(bind)
+        _inspector_cache[bind] = inspector
+    return inspector
+
+
+def clear_inspector_cache() -> None:
+    """Drop all cached Inspectors (and their reflection caches)."""
+    _inspector_cache.clear()
+
+
+def existing_columns(table_name: str) -> Set[str]:
+    """
+    Get the names of all columns in a table with a single reflection call.
+
+    Hoist this once per table at the top of upgrade()/downgrade() and test
+    membership against the returned set instead of calling column_exists()
+    repeatedly.
+    """
+    inspector = get_cached_inspector()
+    return {col["name"] for col in inspector.get_columns(table_name)}
 
 
 def column_exists(table_name: str, column_name: str) -> bool:
     """Check if a column exists in a table."""
-    connection = op.get_bind()
-    inspector = inspect(connection)
-    columns = [col["name"] for col in inspector.get_columns(table_name)]
-    return column_name in columns
+    return column_name in existing_columns(table_name)
 
 
 def table_exists(table_name: str) -> bool:
     """Check if a table exists."""
-    connection = op.get_bind()
-    inspector = inspect(connection)
+    inspector = get_cached_inspector()
     return table_name in inspector.get_table_names()
 
 
@@ -41,8 +84,10 @@ def index_exists(index_name: str) -> bool:
 
 
 def enum_exists(enum_name: str) -> bool:
-    """Check if a PostgreSQL enum type exists."""
+    """Check if a PostgreSQL enum type exists (always False on other dialects)."""
     connection = op.get_bind()
+    if connection.dialect.name != "postgresql":
+        return False
     result = connection.execute(
         text(
             """
@@ -56,37 +101,227 @@ def enum_exists(enum_name: str) -> bool:
     return result
 
 
+def existing_indexes() -> Set[str]:
+    """
+    Get the names of all indexes in the current schema with a single query.
+
+    Hoist this once at the top of upgrade() and pass it as cached_indexes to
+    safe_create_index() instead of checking index by index.
+    """
+    connection = op.get_bind()
+    if connection.dialect.name != "postgresql":
+        inspector = get_cached_inspector()
+        return {
+            index["name"]
+            for table in inspector.get_table_names()
+            for index in inspector.get_indexes(table)
+        }
+    return set(
+        connection.execute(
+            text(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE schemaname = current_schema()"
+            )
+        ).scalars()
+    )
+
+
+def existing_enums() -> Set[str]:
+    """
+    Get the names of all PostgreSQL enum types with a single query (always
+    empty on other dialects).
+
+    Hoist this once at the top of upgrade() and pass it as cached_enums to
+    safe_create_enum() instead of checking enum by enum.
+    """
+    connection = op.get_bind()
+    if connection.dialect.name != "postgresql":
+        return set()
+    return set(
+        connection.execute(
+            text("SELECT typname FROM pg_type WHERE typtype = 'e'")
+        ).scalars()
+    )
+
+
 def safe_add_column(
     table_name: str,
     column_name: str,
     column_type,
     nullable: bool = True,
+    cached_columns: Optional[Set[str]] = None,
     **kwargs,
 ) -> bool:
     """
     Safely add a column to a table (only if it doesn't exist).
+
+    Without cached_columns, PostgreSQL gets a single ADD COLUMN IF NOT EXISTS
+    statement instead of a reflection query followed by the DDL.
+
+    Args:
+        cached_columns: Result of existing_columns(table_name) to check against
+            instead of reflecting again; updated in place when the column is added
     
     Returns:
-        bool: True if column was added, False if it already existed
+        bool: True if column was added (or ADD COLUMN IF NOT EXISTS was issued),
+            False if it already existed
     """
-    if column_exists(table_name, column_name):
+    column = sa.Column(column_name, column_type, nullable=nullable, **kwargs)
+    bind = op.get_bind()
+    if cached_columns is None and bind.dialect.name == "postgresql":
+        column_sql = CreateColumn(column).compile(dialect=bind.dialect)
+        op.execute(f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {column_sql}")
+        clear_inspector_cache()
+        return True
+
+    columns = cached_columns if cached_columns is not None else existing_columns(table_name)
+    if column_name in columns:
         return False
     
-    op.add_column(table_name, sa.Column(column_name, column_type, nullable=nullable, **kwargs))
+    op.add_column(table_name, column)
+    clear_inspector_cache()
+    if cached_columns is not None:
+        cached_columns.add(column_name)
     return True
 
 
-def safe_drop_column(table_name: str, column_name: str) -> bool:
+def safe_add_columns(
+    table_name: str,
+    columns: List[sa.Column],
+    cached_columns: Optional[Set[str]] = None,
+) -> List[str]:
+    """
+    Safely add several columns to a table (skipping any that already exist).
+
+    Shorthand for safe_alter_table(table_name, add=columns).
+
+    Args:
+        columns: Column objects to add
+        cached_columns: Result of existing_columns(table_name) to check against
+            instead of reflecting again; updated in place with the added columns
+
+    Returns:
+        List[str]: Names of the columns that were added
+    """
+    added, _ = safe_alter_table(table_name, add=columns, cached_columns=cached_columns)
+    return added
+
+
+def safe_alter_table(
+    table_name: str,
+    add: Sequence[sa.Column] = (),
+    drop: Sequence[str] = (),
+    cached_columns: Optional[Set[str]] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Safely add and drop several columns of a table in one statement.
+
+    Columns in add that already exist and names in drop that don't are
+    skipped. On PostgreSQL the rest go into a single ALTER TABLE with one
+    ADD/DROP COLUMN clause each, so the ACCESS EXCLUSIVE lock is taken and the
+    catalog written once instead of per column. Other dialects use Alembic's
+    batch mode (one table rebuild on SQLite when one is needed).
+
+    Args:
+        add: Column objects to add
+        drop: Names of columns to drop
+        cached_columns: Result of existing_columns(table_name) to check against
+            instead of reflecting again; updated in place
+
+    Returns:
+        Tuple[List[str], List[str]]: Names of the added and the dropped columns
+    """
+    present = cached_columns if cached_columns is not None else existing_columns(table_name)
+    to_add = [column for column in add if column.name not in present]
+    to_drop = [name for name in drop if name in present]
+    if not to_add and not to_drop:
+        return [], []
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        clauses = [
+            f"ADD COLUMN {CreateColumn(column).compile(dialect=bind.dialect)}"
+            for column in to_add
+        ] + [f"DROP COLUMN {name}" for name in to_drop]
+        op.execute(f"ALTER TABLE {table_name} {', '.join(clauses)}")
+    else:
+        with op.batch_alter_table(table_name) as batch_op:
+            for column in to_add:
+                batch_op.add_column(column)
+            for name in to_drop:
+                batch_op.drop_column(name)
+
+    clear_inspector_cache()
+    added = [column.name for column in to_add]
+    if cached_columns is not None:
+        cached_columns.update(added)
+        cached_columns.difference_update(to_drop)
+    return added, to_drop
+
+
+def safe_drop_column(
+    table_name: str, column_name: str, cached_columns: Optional[Set[str]] = None
+) -> bool:
     """
     Safely drop a column from a table (only if it exists).
+
+    Args:
+        cached_columns: Result of existing_columns(table_name) to check against
+            instead of reflecting again; updated in place when the column is dropped
     
     Returns:
         bool: True if column was dropped, False if it didn't exist
     """
-    if not column_exists(table_name, column_name):
+    columns = cached_columns if cached_columns is not None else existing_columns(table_name)
+    if column_name not in columns:
         return False
     
     op.drop_column(table_name, column_name)
+    clear_inspector_cache()
+    if cached_columns is not None:
+        cached_columns.discard(column_name)
+    return True
+
+
+def set_not_null(table_name: str, column_name: str) -> bool:
+    """
+    Promote a column to NOT NULL.
+
+    On PostgreSQL this attaches a CHECK (column IS NOT NULL) NOT VALID
+    constraint, validates it, then sets NOT NULL, which PostgreSQL 12+ proves
+    from the validated constraint instead of rescanning the table. The helper
+    constraint is dropped afterwards. Other dialects fall back to a plain
+    ALTER COLUMN.
+
+    All steps run in the migration's transaction, so the ACCESS EXCLUSIVE
+    lock taken by ADD CONSTRAINT is held until commit and the table stays
+    locked during the validation scan, as with a plain SET NOT NULL. A
+    lighter lock would need the steps committed separately.
+
+    Returns:
+        bool: True if the column was altered, False if it was already NOT NULL
+    """
+    # The cached reflection is reused, so this costs no extra catalog query;
+    # a column added earlier in the same migration is not in it and is
+    # treated as nullable
+    columns = {
+        col["name"]: col for col in get_cached_inspector().get_columns(table_name)
+    }
+    if column_name in columns and not columns[column_name]["nullable"]:
+        return False
+
+    if op.get_bind().dialect.name != "postgresql":
+        op.alter_column(table_name, column_name, nullable=False)
+        return True
+
+    constraint_name = f"{table_name}_{column_name}_not_null"
+    op.execute(
+        f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint_name} "
+        f"CHECK ({column_name} IS NOT NULL) NOT VALID"
+    )
+    op.execute(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {constraint_name}")
+    op.alter_column(table_name, column_name, nullable=False)
+    op.execute(f"ALTER TABLE {table_name} DROP CONSTRAINT {constraint_name}")
     return True
 
 
@@ -101,34 +336,156 @@ def safe_create_table(table_name: str, *columns, **kwargs) -> bool:
         return False
     
     op.create_table(table_name, *columns, **kwargs)
+    clear_inspector_cache()
     return True
 
 
-def safe_create_index(index_name: str, table_name: str, columns: list, unique: bool = False) -> bool:
+def safe_create_index(
+    index_name: str,
+    table_name: str,
+    columns: list,
+    unique: bool = False,
+    where: Optional[str] = None,
+    cached_indexes: Optional[Set[str]] = None,
+    using: Optional[str] = None,
+) -> bool:
     """
     Safely create an index (only if it doesn't exist).
+
+    PostgreSQL and SQLite use CREATE INDEX IF NOT EXISTS, so the check and the
+    DDL are a single statement; other dialects look the index up first.
+
+    Args:
+        where: SQL predicate for a partial index (PostgreSQL/SQLite only;
+            other dialects get a full index)
+        cached_indexes: Result of existing_indexes() to check against instead
+            of touching the database; updated in place when the index is created
+        using: Index access method, e.g. "gin" (PostgreSQL only)
     
     Returns:
-        bool: True if index was created, False if it already existed
+        bool: True if index was created (or CREATE INDEX IF NOT EXISTS was
+            issued), False if it already existed
     """
-    if index_exists(index_name):
+    if cached_indexes is not None:
+        if index_name in cached_indexes:
+            return False
+        cached_indexes.add(index_name)
+
+    dialect_name = op.get_bind().dialect.name
+    if dialect_name in ("postgresql", "sqlite"):
+        unique_sql = "UNIQUE " if unique else ""
+        using_sql = f" USING {using}" if using and dialect_name == "postgresql" else ""
+        where_sql = f" WHERE {where}" if where else ""
+        op.execute(
+            f"CREATE {unique_sql}INDEX IF NOT EXISTS {index_name} "
+            f"ON {table_name}{using_sql} ({', '.join(columns)}){where_sql}"
+        )
+        return True
+
+    if cached_indexes is None and index_exists(index_name):
         return False
     
     op.create_index(index_name, table_name, columns, unique=unique)
     return True
 
 
-def safe_create_enum(enum_name: str, values: list) -> bool:
+def safe_create_enum(
+    enum_name: str, values: list, cached_enums: Optional[Set[str]] = None
+) -> bool:
     """
     Safely create a PostgreSQL enum type (only if it doesn't exist).
+
+    The CREATE TYPE is compiled by SQLAlchemy's PostgreSQL ENUM type, which
+    quotes the name and values, and its checkfirst lookup replaces a separate
+    enum_exists() call. Other dialects have no named enum types, so nothing is
+    issued there.
+
+    Args:
+        cached_enums: Result of existing_enums() to check against instead of
+            querying pg_type; updated in place when the enum is created
     
     Returns:
-        bool: True if enum was created, False if it already existed
+        bool: True if enum was created (or created with checkfirst), False if
+            it already existed in cached_enums or the dialect has no enum types
     """
-    if enum_exists(enum_name):
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
         return False
-    
-    values_str = ", ".join(f"'{v}'" for v in values)
-    op.execute(f"CREATE TYPE {enum_name} AS ENUM ({values_str})")
+    if cached_enums is not None and enum_name in cached_enums:
+        return False
+
+    postgresql.ENUM(*values, name=enum_name).create(
+        bind, checkfirst=cached_enums is None
+    )
+    if cached_enums is not None:
+        cached_enums.add(enum_name)
     return True
 
+
+def safe_drop_enum(enum_name: str) -> bool:
+    """
+    Safely drop a PostgreSQL enum type (only if it exists).
+
+    Other dialects have no named enum types, so nothing is issued there.
+
+    Returns:
+        bool: True if DROP TYPE IF EXISTS was issued, False on other dialects
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return False
+
+    op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+    return True
+
+
+# Shared by every table whose updated_at is maintained by the database
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def create_updated_at_trigger(table_name: str) -> bool:
+    """
+    Maintain table_name.updated_at with a BEFORE UPDATE trigger.
+
+    Creates (or replaces) the shared set_updated_at() function and attaches
+    a {table_name}_set_updated_at trigger to the table, replacing any
+    existing trigger of that name. PostgreSQL only.
+
+    Returns:
+        bool: True if the trigger was created, False on other dialects
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return False
+
+    trigger_name = f"{table_name}_set_updated_at"
+    op.execute(SET_UPDATED_AT_FUNCTION)
+    op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON {table_name}")
+    op.execute(
+        f"CREATE TRIGGER {trigger_name} BEFORE UPDATE ON {table_name} "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+    return True
+
+
+def drop_updated_at_trigger(table_name: str) -> bool:
+    """
+    Drop the trigger added by create_updated_at_trigger().
+
+    The shared set_updated_at() function is left for the other tables.
+
+    Returns:
+        bool: True if DROP TRIGGER IF EXISTS was issued, False on other dialects
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return False
+
+    op.execute(
+        f"DROP TRIGGER IF EXISTS {table_name}_set_updated_at ON {table_name}"
+    )
+    return True
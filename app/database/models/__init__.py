@@ -4,10 +4,18 @@ Database models package.
 Includes Party, Constituency, Candidate, Election, and User models with CRUD operations.
 """
 
-from .candidate import Candidate
+from .candidate import Candidate, CandidateStatus, CandidateType
 from .constituency import Constituency
 from .election import Election
 from .party import Party
 from .user import User
 
-__all__ = ["Party", "Constituency", "Candidate", "Election", "User"]
+__all__ = [
+    "Party",
+    "Constituency",
+    "Candidate",
+    "CandidateStatus",
+    "CandidateType",
+    "Election",
+    "User",
+]
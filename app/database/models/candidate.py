@@ -2,21 +2,74 @@
 Candidate database model with CRUD operations.
 """
 
+import enum
 import logging
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import DDL, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import String
+from sqlalchemy import Index, String, event, func, insert, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.types import JSON
 
-from ..base import Base
+from ..base import BULK_CHUNK_SIZE, Base, execute_chunked, mutable_columns
 
 logger = logging.getLogger(__name__)
 
+# Generic JSON elsewhere, binary (parsed, indexable) jsonb on PostgreSQL
+JSON_VARIANT = JSON().with_variant(JSONB(), "postgresql")
+
+
+class CandidateStatus(str, enum.Enum):
+    """Election result of a candidate (PostgreSQL enum candidate_status)"""
+
+    WON = "WON"
+    LOST = "LOST"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class CandidateType(str, enum.Enum):
+    """Kind of seat a candidate contested (PostgreSQL enum candidate_type)"""
+
+    MP = "MP"
+    MLA = "MLA"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# Upper bound on search_by_name results when no limit is given
+SEARCH_RESULTS_LIMIT = 200
+
+# Escape LIKE wildcards (and the escape character itself) in search terms
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+# Rows per INSERT ... ON CONFLICT statement in bulk_upsert; with ~18 bound
+# columns per row this stays far below PostgreSQL's 65535 parameter limit
+BULK_UPSERT_PAGE_SIZE = 1000
+
+# Columns overwritten from the incoming row when a candidate already exists
+UPSERT_UPDATE_COLUMNS = (
+    "name",
+    "party_id",
+    "constituency_id",
+    "original_constituency_id",
+    "state_id",
+    "status",
+    "type",
+    "image_url",
+    "education_background",
+    "political_background",
+    "family_background",
+    "assets",
+    "liabilities",
+    "crime_cases",
+)
+
 
 class Candidate(Base):
     """
@@ -28,32 +81,78 @@ class Candidate(Base):
     __tablename__ = "candidates"
 
     # Columns
-    id = Column(String, primary_key=True, index=True)
+    # party_id and constituency_id are covered by the leading columns of the
+    # composite indexes in __table_args__, and id by its primary key index
+    id = Column(String, primary_key=True)
     name = Column(String, nullable=False, index=True)
-    party_id = Column(String, nullable=False, index=True)
-    constituency_id = Column(String, nullable=False, index=True)  # unique_id reference
+    party_id = Column(String, nullable=False)
+    constituency_id = Column(String, nullable=False)  # unique_id reference
     original_constituency_id = Column(
         String, nullable=True
     )  # Original ID for backward compatibility
-    state_id = Column(String, nullable=False, index=True)
+    state_id = Column(String(8), nullable=False, index=True)
     image_url = Column(String, nullable=True)
-    status = Column(SQLEnum("WON", "LOST", name="candidate_status"), nullable=False)
+    # Python enum members (str subclasses, so comparisons with plain strings
+    # and JSON output are unchanged) mapped to the same native PG enum types
+    status = Column(SQLEnum(CandidateStatus, name="candidate_status"), nullable=False)
     type = Column(
-        SQLEnum("MP", "MLA", name="candidate_type"), nullable=False, default="MP"
+        SQLEnum(CandidateType, name="candidate_type"),
+        nullable=False,
+        default=CandidateType.MP,
     )
 
     # New detailed information fields (JSON/JSONB for flexibility)
     # Using JSON for SQLite compatibility and JSONB for PostgreSQL performance
-    education_background = Column(JSON, nullable=True)
-    political_background = Column(JSON, nullable=True)
-    family_background = Column(JSON, nullable=True)
-    assets = Column(JSON, nullable=True)
-    liabilities = Column(JSON, nullable=True)
-    crime_cases = Column(JSON, nullable=True)
+    education_background = Column(JSON_VARIANT, nullable=True)
+    political_background = Column(JSON_VARIANT, nullable=True)
+    family_background = Column(JSON_VARIANT, nullable=True)
+    assets = Column(JSON_VARIANT, nullable=True)
+    liabilities = Column(JSON_VARIANT, nullable=True)
+    crime_cases = Column(JSON_VARIANT, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Set by the database: now() on insert and in every ORM UPDATE; the
+    # candidates_set_updated_at trigger (PostgreSQL) covers other writes
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Covers per-constituency listings ordered winners-first, then by name
+        Index(
+            "ix_candidates_constituency_status_name",
+            "constituency_id",
+            "status",
+            "name",
+        ),
+        # pg_trgm GIN index on lower(name) for search_by_name's substring
+        # match; a plain expression index on other databases
+        Index(
+            "ix_candidates_name_trgm",
+            func.lower(name).label("lower_name"),
+            postgresql_using="gin",
+            postgresql_ops={"lower_name": "gin_trgm_ops"},
+        ),
+        # Covers keyset pagination of candidates by status (e.g. winners)
+        Index("ix_candidates_status_id", "status", "id"),
+        # Covers per-party candidate listings and per-party status counts
+        Index("ix_candidates_party_status", "party_id", "status"),
+        # Partial index over winners only (~6% of rows) for winner listings
+        # and per-party seat counts
+        Index(
+            "ix_candidates_winners",
+            "party_id",
+            "id",
+            postgresql_where=text("status = 'WON'"),
+            sqlite_where=text("status = 'WON'"),
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<Candidate(id={self.id}, name={self.name}, party_id={self.party_id})>"
@@ -79,6 +178,7 @@ class Candidate(Base):
         assets: Optional[List[Dict[str, Any]]] = None,
         liabilities: Optional[List[Dict[str, Any]]] = None,
         crime_cases: Optional[List[Dict[str, Any]]] = None,
+        flush: bool = True,
     ) -> "Candidate":
         """
         Create a new candidate.
@@ -100,19 +200,21 @@ class Candidate(Base):
             assets: Assets data (optional)
             liabilities: Liabilities data (optional)
             crime_cases: Crime cases data (optional)
+            flush: Flush now; pass False to leave it to the caller's next flush
 
         Returns:
             Created Candidate instance
         """
-        logger.info(f"Creating candidate: {name} (ID: {id})")
-        if education_background:
-            logger.debug(f"Education background provided for {name}")
-        if political_background:
-            logger.debug(f"Political background provided for {name}")
-        if family_background:
-            logger.debug(f"Family background provided for {name}")
-        if assets:
-            logger.debug(f"Assets information provided for {name}")
+        logger.info("Creating candidate: %s (ID: %s)", name, id)
+        if logger.isEnabledFor(logging.DEBUG):
+            if education_background:
+                logger.debug("Education background provided for %s", name)
+            if political_background:
+                logger.debug("Political background provided for %s", name)
+            if family_background:
+                logger.debug("Family background provided for %s", name)
+            if assets:
+                logger.debug("Assets information provided for %s", name)
 
         candidate = cls(
             id=id,
@@ -121,8 +223,8 @@ class Candidate(Base):
             constituency_id=constituency_id,
             original_constituency_id=original_constituency_id,
             state_id=state_id,
-            status=status,
-            type=type,
+            status=CandidateStatus(status),
+            type=CandidateType(type),
             image_url=image_url,
             education_background=education_background,
             political_background=political_background,
@@ -132,8 +234,9 @@ class Candidate(Base):
             crime_cases=crime_cases,
         )
         session.add(candidate)
-        session.flush()
-        logger.info(f"Candidate {name} created successfully")
+        if flush:
+            session.flush()
+        logger.info("Candidate %s created successfully", name)
         return candidate
 
     @classmethod
@@ -148,7 +251,7 @@ class Candidate(Base):
         Returns:
             Candidate instance or None if not found
         """
-        return session.query(cls).filter(cls.id == candidate_id).first()
+        return session.get(cls, candidate_id)
 
     @classmethod
     def get_by_party(cls, session: Session, party_id: str) -> List["Candidate"]:
@@ -182,133 +285,178 @@ class Candidate(Base):
 
     @classmethod
     def get_winners(
-        cls, session: Session, skip: int = 0, limit: int = 100
+        cls, session: Session, after_id: Optional[str] = None, limit: int = 100
     ) -> List["Candidate"]:
         """
-        Get all winning candidates with pagination.
+        Get all winning candidates with keyset pagination.
 
         Args:
             session: Database session
-            skip: Number of records to skip
+            after_id: ID of the last candidate on the previous page (None for
+                the first page)
             limit: Maximum number of records to return
 
         Returns:
-            List of Candidate instances
+            List of Candidate instances ordered by ID
         """
-        return (
-            session.query(cls)
-            .filter(cls.status == "WON")
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = session.query(cls).filter(cls.status == CandidateStatus.WON)
+        if after_id is not None:
+            query = query.filter(cls.id > after_id)
+        return query.order_by(cls.id).limit(limit).all()
 
     @classmethod
-    def search_by_name(cls, session: Session, name: str) -> List["Candidate"]:
+    def search_by_name(
+        cls, session: Session, name: str, limit: Optional[int] = None
+    ) -> List["Candidate"]:
         """
         Search candidates by name (case-insensitive, partial match).
 
+        % and _ in name match literally rather than as LIKE wildcards.
+
         Args:
             session: Database session
             name: Name to search for
+            limit: Maximum number of records to return (defaults to
+                SEARCH_RESULTS_LIMIT)
 
         Returns:
-            List of Candidate instances
+            List of Candidate instances, ordered by name
         """
-        return session.query(cls).filter(cls.name.ilike(f"%{name}%")).all()
+        pattern = "%" + name.lower().translate(_LIKE_ESCAPES) + "%"
+        # lower(name) LIKE matches the ix_candidates_name_trgm GIN index on
+        # PostgreSQL; a leading wildcard can't use the plain btree on name
+        return (
+            session.query(cls)
+            .filter(func.lower(cls.name).like(pattern, escape="\\"))
+            .order_by(cls.name, cls.id)
+            .limit(limit or SEARCH_RESULTS_LIMIT)
+            .all()
+        )
 
     @classmethod
     def get_all(
-        cls, session: Session, skip: int = 0, limit: int = 100
+        cls, session: Session, after_id: Optional[str] = None, limit: int = 100
     ) -> List["Candidate"]:
         """
-        Get all candidates with pagination.
+        Get all candidates with keyset pagination.
+
+        Seeking past after_id on the primary key costs the same for every page,
+        unlike OFFSET, which scans and discards all the skipped rows.
 
         Args:
             session: Database session
-            skip: Number of records to skip
+            after_id: ID of the last candidate on the previous page (None for
+                the first page)
             limit: Maximum number of records to return
 
         Returns:
-            List of Candidate instances
+            List of Candidate instances ordered by ID
         """
-        return session.query(cls).offset(skip).limit(limit).all()
+        query = session.query(cls)
+        if after_id is not None:
+            query = query.filter(cls.id > after_id)
+        return query.order_by(cls.id).limit(limit).all()
 
-    def update(self, session: Session, **kwargs) -> "Candidate":
+    def update(self, session: Session, flush: bool = False, **kwargs) -> "Candidate":
         """
         Update candidate attributes.
 
         Args:
             session: Database session
-            **kwargs: Attributes to update
+            flush: Flush immediately instead of leaving it to the caller's
+                next flush/commit (lets bulk callers batch their writes)
+            **kwargs: Attributes to update; anything that is not a mutable
+                column is ignored
 
         Returns:
             Updated Candidate instance
         """
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _MUTABLE_COLUMNS:
                 setattr(self, key, value)
-        
-        # Explicitly update the updated_at timestamp
-        self.updated_at = datetime.utcnow()
-        
-        session.flush()
+
+        if flush:
+            session.flush()
         return self
 
-    def delete(self, session: Session) -> None:
+    def delete(self, session: Session, flush: bool = False) -> None:
         """
         Delete this candidate.
 
         Args:
             session: Database session
+            flush: Flush now instead of leaving it to the caller's next
+                flush/commit
         """
         session.delete(self)
-        session.flush()
+        if flush:
+            session.flush()
 
     @classmethod
-    def bulk_create(cls, session: Session, candidates: List[dict]) -> List["Candidate"]:
+    def bulk_create(
+        cls,
+        session: Session,
+        candidates: List[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        drop_indexes: bool = False,
+    ) -> List["Candidate"]:
         """
         Create multiple candidates at once.
 
         Args:
             session: Database session
             candidates: List of candidate dictionaries
+            chunk_size: Rows per execute
+            drop_indexes: Rebuild non-unique indexes once after the load
+                instead of maintaining them; locks the table until commit
+                (see Base.defer_indexes)
 
         Returns:
-            List of created Candidate instances
+            List of Candidate instances built from the inserted values (not
+            attached to the session)
         """
-        logger.info(f"Bulk creating {len(candidates)} candidates")
-        candidate_objects = [
-            cls(
-                id=c["id"],
-                name=c["name"],
-                party_id=c["party_id"],
-                constituency_id=c.get(
-                    "constituency_unique_id", c.get("constituency_id")
-                ),
-                original_constituency_id=c.get(
-                    "constituency_id"
-                ),  # Keep original for compatibility
-                state_id=c["state_id"],
-                status=c["status"],
-                type=c.get("type", "MP"),
-                image_url=c.get("image_url"),
-                education_background=c.get("education_background"),
-                political_background=c.get("political_background"),
-                family_background=c.get("family_background"),
-                assets=c.get("assets"),
-                liabilities=c.get("liabilities"),
-                crime_cases=c.get("crime_cases"),
-            )
-            for c in candidates
-        ]
-        session.bulk_save_objects(candidate_objects, return_defaults=True)
-        session.flush()
-        logger.info(f"Successfully bulk created {len(candidate_objects)} candidates")
-        return candidate_objects
+        logger.info("Bulk creating %d candidates", len(candidates))
+        values = [cls._to_row(c) for c in candidates]
+        # Core executemany: SQLAlchemy batches this into multi-row INSERTs
+        # (insertmanyvalues) instead of one INSERT per object, since the ids
+        # are client-supplied and nothing needs to be read back
+        with cls.defer_indexes(session, drop_indexes):
+            execute_chunked(session, _INSERT_STMT, values, chunk_size)
+        logger.info("Successfully bulk created %d candidates", len(values))
+        return [cls(**v) for v in values]
+
+    @staticmethod
+    def _to_row(c: dict) -> Dict[str, Any]:
+        """Map an input candidate dictionary to candidates table column values."""
+        return {
+            "id": c["id"],
+            "name": c["name"],
+            "party_id": c["party_id"],
+            "constituency_id": c.get(
+                "constituency_unique_id", c.get("constituency_id")
+            ),
+            # Keep original for compatibility
+            "original_constituency_id": c.get("constituency_id"),
+            "state_id": c["state_id"],
+            "status": CandidateStatus(c["status"]),
+            "type": CandidateType(c.get("type", "MP")),
+            "image_url": c.get("image_url"),
+            "education_background": c.get("education_background"),
+            "political_background": c.get("political_background"),
+            "family_background": c.get("family_background"),
+            "assets": c.get("assets"),
+            "liabilities": c.get("liabilities"),
+            "crime_cases": c.get("crime_cases"),
+        }
 
     @classmethod
-    def bulk_upsert(cls, session: Session, candidates: List[dict]) -> int:
+    def bulk_upsert(
+        cls,
+        session: Session,
+        candidates: List[dict],
+        chunk_size: int = BULK_UPSERT_PAGE_SIZE,
+        drop_indexes: bool = False,
+    ) -> int:
         """
         Upsert multiple candidates at once (insert if not exists, update if exists).
 
@@ -318,6 +466,10 @@ class Candidate(Base):
         Args:
             session: Database session
             candidates: List of candidate dictionaries
+            chunk_size: Rows per execute
+            drop_indexes: Rebuild non-unique indexes once after the load
+                instead of maintaining them; locks the table until commit
+                (see Base.defer_indexes)
 
         Returns:
             Number of records processed (inserted or updated)
@@ -325,57 +477,42 @@ class Candidate(Base):
         if not candidates:
             return 0
 
-        logger.info(f"Bulk upserting {len(candidates)} candidates")
+        logger.info("Bulk upserting %d candidates", len(candidates))
 
         # Prepare data for bulk insert
-        values = []
-        for c in candidates:
-            values.append(
-                {
-                    "id": c["id"],
-                    "name": c["name"],
-                    "party_id": c["party_id"],
-                    "constituency_id": c.get(
-                        "constituency_unique_id", c.get("constituency_id")
-                    ),
-                    "original_constituency_id": c.get("constituency_id"),
-                    "state_id": c["state_id"],
-                    "status": c["status"],
-                    "type": c.get("type", "MP"),
-                    "image_url": c.get("image_url"),
-                    "education_background": c.get("education_background"),
-                    "political_background": c.get("political_background"),
-                    "family_background": c.get("family_background"),
-                    "assets": c.get("assets"),
-                    "liabilities": c.get("liabilities"),
-                    "crime_cases": c.get("crime_cases"),
-                }
-            )
-
-        # Use PostgreSQL's ON CONFLICT DO UPDATE
-        stmt = pg_insert(cls.__table__).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["id"],
-            set_={
-                "name": stmt.excluded.name,
-                "party_id": stmt.excluded.party_id,
-                "constituency_id": stmt.excluded.constituency_id,
-                "original_constituency_id": stmt.excluded.original_constituency_id,
-                "state_id": stmt.excluded.state_id,
-                "status": stmt.excluded.status,
-                "type": stmt.excluded.type,
-                "image_url": stmt.excluded.image_url,
-                "education_background": stmt.excluded.education_background,
-                "political_background": stmt.excluded.political_background,
-                "family_background": stmt.excluded.family_background,
-                "assets": stmt.excluded.assets,
-                "liabilities": stmt.excluded.liabilities,
-                "crime_cases": stmt.excluded.crime_cases,
-                "updated_at": datetime.utcnow(),  # Update timestamp on conflict
-            },
-        )
+        values = list(map(cls._to_row, candidates))
+
+        # Use PostgreSQL's ON CONFLICT DO UPDATE. The statement is built once
+        # at import and executed per page as an executemany, so its compiled
+        # form comes from SQLAlchemy's statement cache; pages keep the bind
+        # parameters under PostgreSQL's 65535 limit and memory bounded
+        with cls.defer_indexes(session, drop_indexes):
+            execute_chunked(session, _UPSERT_STMT, values, chunk_size)
 
-        session.execute(stmt)
         session.flush()
-        logger.info(f"Successfully bulk upserted {len(candidates)} candidates")
+        logger.info("Successfully bulk upserted %d candidates", len(candidates))
         return len(candidates)
+
+
+# ix_candidates_name_trgm's operator class comes from pg_trgm, so
+# create_all() installs it first, as the index's migration does
+event.listen(
+    Candidate.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+_MUTABLE_COLUMNS = mutable_columns(Candidate.__table__)
+
+_INSERT_STMT = insert(Candidate.__table__)
+
+_upsert = pg_insert(Candidate.__table__)
+_UPSERT_STMT = _upsert.on_conflict_do_update(
+    index_elements=["id"],
+    set_={
+        **{name: _upsert.excluded[name] for name in UPSERT_UPDATE_COLUMNS},
+        # Also set by the update trigger; kept so the upsert does not depend on it
+        "updated_at": func.now(),
+    },
+)
+del _upsert
@@ -2,13 +2,21 @@
 Constituency database model with CRUD operations.
 """
 
+import csv
+import io
 from typing import List, Optional
 
-from sqlalchemy import Column, Enum as SQLEnum, String
+from sqlalchemy import Column, Enum as SQLEnum, Index, Row, String, insert, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from ..base import Base
+from ..base import BULK_CHUNK_SIZE, Base, execute_chunked, mutable_columns
+
+# bulk_upsert batches at least this large are streamed with COPY into a
+# staging table and merged from there, rather than sent as one huge INSERT
+COPY_THRESHOLD = 1000
+
+_COPY_COLUMNS = ("id", "original_id", "name", "state_id")
 
 
 class Constituency(Base):
@@ -19,16 +27,24 @@ class Constituency(Base):
     """
 
     __tablename__ = "constituencies"
+    __table_args__ = (
+        # Serves get_by_state (and state + type filters); on PostgreSQL the
+        # remaining columns are INCLUDEd so those reads are index-only scans
+        Index(
+            "ix_constituencies_state_type",
+            "state_id",
+            "type",
+            postgresql_include=["id", "original_id", "name"],
+        ),
+    )
 
     # Columns
-    id = Column(
-        String, primary_key=True, index=True
-    )  # unique_id (format: "{id}-{state_id}")
+    id = Column(String, primary_key=True)  # unique_id (format: "{id}-{state_id}")
     original_id = Column(
         String, nullable=False
     )  # Original constituency ID for scraping
     name = Column(String, nullable=False, index=True)
-    state_id = Column(String, nullable=False, index=True)
+    state_id = Column(String(8), nullable=False)
     type = Column(SQLEnum("VS", "LS", name="constituency_type"), nullable=False)
 
     def __repr__(self) -> str:
@@ -46,6 +62,7 @@ class Constituency(Base):
         name: str,
         state_id: str,
         original_id: str = None,
+        flush: bool = True,
     ) -> "Constituency":
         """
         Create a new constituency.
@@ -56,6 +73,7 @@ class Constituency(Base):
             name: Constituency name
             state_id: State ID code
             original_id: Original constituency ID for scraping (defaults to extracting from id)
+            flush: Flush now; pass False to leave it to the caller's next flush
 
         Returns:
             Created Constituency instance
@@ -74,7 +92,8 @@ class Constituency(Base):
             state_id=state_id,
         )
         session.add(constituency)
-        session.flush()
+        if flush:
+            session.flush()
         return constituency
 
     @classmethod
@@ -91,7 +110,7 @@ class Constituency(Base):
         Returns:
             Constituency instance or None if not found
         """
-        return session.query(cls).filter(cls.id == constituency_id).first()
+        return session.get(cls, constituency_id)
 
     @classmethod
     def get_by_state(cls, session: Session, state_id: str) -> List["Constituency"]:
@@ -109,51 +128,89 @@ class Constituency(Base):
 
     @classmethod
     def get_all(
-        cls, session: Session, skip: int = 0, limit: int = 100
+        cls, session: Session, after_id: Optional[str] = None, limit: int = 100
     ) -> List["Constituency"]:
         """
-        Get all constituencies with pagination.
+        Get all constituencies with keyset pagination.
 
         Args:
             session: Database session
-            skip: Number of records to skip
+            after_id: ID of the last constituency on the previous page (None for
+                the first page)
             limit: Maximum number of records to return
 
         Returns:
-            List of Constituency instances
+            List of Constituency instances ordered by ID
         """
-        return session.query(cls).offset(skip).limit(limit).all()
+        query = session.query(cls)
+        if after_id is not None:
+            query = query.filter(cls.id > after_id)
+        return query.order_by(cls.id).limit(limit).all()
 
-    def update(self, session: Session, **kwargs) -> "Constituency":
+    @classmethod
+    def list_rows(
+        cls, session: Session, after_id: Optional[str] = None, limit: int = 100
+    ) -> List[Row]:
+        """
+        Get constituencies as plain rows with pagination.
+
+        Same page as get_all, but as Core rows (attribute access by column
+        name) without building ORM instances; for read-only listings.
+
+        Args:
+            session: Database session
+            after_id: ID of the last constituency on the previous page (None for
+                the first page)
+            limit: Maximum number of records to return
+
+        Returns:
+            List of rows of the table's columns, ordered by ID
+        """
+        stmt = select(cls.__table__)
+        if after_id is not None:
+            stmt = stmt.where(cls.id > after_id)
+        return session.execute(stmt.order_by(cls.id).limit(limit)).all()
+
+    def update(self, session: Session, flush: bool = False, **kwargs) -> "Constituency":
         """
         Update constituency attributes.
 
         Args:
             session: Database session
+            flush: Flush now instead of leaving it to the caller's next
+                flush/commit
             **kwargs: Attributes to update
 
         Returns:
             Updated Constituency instance
         """
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _MUTABLE_COLUMNS:
                 setattr(self, key, value)
-        session.flush()
+        if flush:
+            session.flush()
         return self
 
-    def delete(self, session: Session) -> None:
+    def delete(self, session: Session, flush: bool = False) -> None:
         """
         Delete this constituency.
 
         Args:
             session: Database session
+            flush: Flush now instead of leaving it to the caller's next
+                flush/commit
         """
         session.delete(self)
-        session.flush()
+        if flush:
+            session.flush()
 
     @classmethod
     def bulk_create(
-        cls, session: Session, constituencies: List[dict]
+        cls,
+        session: Session,
+        constituencies: List[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        drop_indexes: bool = False,
     ) -> List["Constituency"]:
         """
         Create multiple constituencies at once.
@@ -161,29 +218,40 @@ class Constituency(Base):
         Args:
             session: Database session
             constituencies: List of constituency dictionaries
+            chunk_size: Rows per execute
+            drop_indexes: Rebuild non-unique indexes once after the load
+                instead of maintaining them; locks the table until commit
+                (see Base.defer_indexes)
 
         Returns:
-            List of created Constituency instances
-        """
-        constituency_objects = [
-            cls(
-                id=c.get(
-                    "unique_id", c.get("id")
-                ),  # Use unique_id if available, fallback to id
-                original_id=c.get(
-                    "id", c.get("original_id", "")
-                ),  # Original ID for scraping
-                name=c["name"],
-                state_id=c["state_id"],
-            )
+            List of Constituency instances built from the inserted values (not
+            attached to the session)
+        """
+        values = [
+            {
+                # Use unique_id if available, fallback to id
+                "id": c.get("unique_id", c.get("id")),
+                # Original ID for scraping
+                "original_id": c.get("id", c.get("original_id", "")),
+                "name": c["name"],
+                "state_id": c["state_id"],
+            }
             for c in constituencies
         ]
-        session.bulk_save_objects(constituency_objects, return_defaults=True)
-        session.flush()
-        return constituency_objects
+        # Core executemany, batched into multi-row INSERTs (insertmanyvalues);
+        # the ids are client-supplied so nothing needs to be read back
+        with cls.defer_indexes(session, drop_indexes):
+            execute_chunked(session, _INSERT_STMT, values, chunk_size)
+        return [cls(**v) for v in values]
 
     @classmethod
-    def bulk_upsert(cls, session: Session, constituencies: List[dict]) -> int:
+    def bulk_upsert(
+        cls,
+        session: Session,
+        constituencies: List[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        drop_indexes: bool = False,
+    ) -> int:
         """
         Upsert multiple constituencies at once (insert if not exists, update if exists).
 
@@ -193,6 +261,10 @@ class Constituency(Base):
         Args:
             session: Database session
             constituencies: List of constituency dictionaries
+            chunk_size: Rows per execute
+            drop_indexes: Rebuild non-unique indexes once after the load
+                instead of maintaining them; locks the table until commit
+                (see Base.defer_indexes)
 
         Returns:
             Number of records processed (inserted or updated)
@@ -204,12 +276,13 @@ class Constituency(Base):
         values = []
         for c in constituencies:
             constituency_id = c.get("unique_id", c.get("id"))
-            original_id = c.get("id", c.get("original_id", ""))
-            # If original_id not provided, extract from id (assuming format "{id}-{state_id}")
-            if not original_id and "-" in constituency_id:
-                original_id = constituency_id.split("-")[0]
-            elif not original_id:
-                original_id = constituency_id
+            # If original_id not provided, extract from id (assuming format
+            # "{id}-{state_id}"); partition() returns the whole id when there
+            # is no "-", in one call and without building a list
+            original_id = (
+                c.get("id", c.get("original_id", ""))
+                or constituency_id.partition("-")[0]
+            )
 
             values.append(
                 {
@@ -220,17 +293,84 @@ class Constituency(Base):
                 }
             )
 
-        # Use PostgreSQL's ON CONFLICT DO UPDATE
-        stmt = pg_insert(cls.__table__).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["id"],
-            set_={
-                "original_id": stmt.excluded.original_id,
-                "name": stmt.excluded.name,
-                "state_id": stmt.excluded.state_id,
-            },
-        )
-
-        session.execute(stmt)
+        with cls.defer_indexes(session, drop_indexes):
+            if len(values) < COPY_THRESHOLD or not cls._copy_upsert(session, values):
+                # Use PostgreSQL's ON CONFLICT DO UPDATE, as one executemany of
+                # the statement built at import; psycopg2 sends it as multi-row
+                # VALUES pages (insertmanyvalues) instead of one inline
+                # parameter per value
+                execute_chunked(session, _UPSERT_STMT, values, chunk_size)
         session.flush()
         return len(constituencies)
+
+    @classmethod
+    def _copy_upsert(cls, session: Session, values: List[dict]) -> bool:
+        """
+        Upsert rows by COPYing them into a temp table and merging from it.
+
+        Args:
+            session: Database session
+            values: List of constituency column dictionaries
+
+        Returns:
+            True once merged, or False without writing anything if the
+            connection can't COPY (i.e. it isn't PostgreSQL via psycopg2)
+        """
+        connection = session.connection()
+        cursor = connection.connection.cursor()
+        if connection.dialect.name != "postgresql" or not hasattr(
+            cursor, "copy_expert"
+        ):
+            cursor.close()
+            return False
+
+        columns = ", ".join(_COPY_COLUMNS)
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerows([v[column] for column in _COPY_COLUMNS] for v in values)
+        buf.seek(0)
+
+        # Staging table lives until the end of the transaction; truncate in
+        # case an earlier call in the same transaction already created it
+        session.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS constituencies_stg "
+                f"ON COMMIT DROP AS SELECT {columns} FROM {cls.__tablename__} "
+                f"WITH NO DATA"
+            )
+        )
+        session.execute(text("TRUNCATE constituencies_stg"))
+        try:
+            cursor.copy_expert(
+                f"COPY constituencies_stg ({columns}) FROM STDIN WITH (FORMAT CSV)",
+                buf,
+            )
+        finally:
+            cursor.close()
+        session.execute(
+            text(
+                f"INSERT INTO {cls.__tablename__} ({columns}) "
+                f"SELECT {columns} FROM constituencies_stg "
+                f"ON CONFLICT (id) DO UPDATE SET "
+                f"original_id = excluded.original_id, "
+                f"name = excluded.name, "
+                f"state_id = excluded.state_id"
+            )
+        )
+        return True
+
+
+_MUTABLE_COLUMNS = mutable_columns(Constituency.__table__)
+
+_INSERT_STMT = insert(Constituency.__table__)
+
+_upsert = pg_insert(Constituency.__table__)
+_UPSERT_STMT = _upsert.on_conflict_do_update(
+    index_elements=["id"],
+    set_={
+        "original_id": _upsert.excluded.original_id,
+        "name": _upsert.excluded.name,
+        "state_id": _upsert.excluded.state_id,
+    },
+)
+del _upsert
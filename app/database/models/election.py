@@ -3,15 +3,15 @@ Election database model with CRUD operations.
 """
 
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import Column
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Integer, String
+from sqlalchemy import Integer, Row, String, bindparam, insert, select, text, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from ..base import Base
+from ..base import BULK_CHUNK_SIZE, Base, execute_chunked, mutable_columns
 
 
 class Election(Base):
@@ -24,7 +24,7 @@ class Election(Base):
     __tablename__ = "elections"
 
     # Columns
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True)
     name = Column(String, nullable=False)
     type = Column(
         SQLEnum("LOK_SABHA", "VIDHAN_SABHA", name="election_type"), nullable=False
@@ -54,6 +54,7 @@ class Election(Base):
         total_candidates: Optional[int] = None,
         total_parties: Optional[int] = None,
         result_status: Optional[str] = None,
+        flush: bool = True,
     ) -> "Election":
         """
         Create a new election.
@@ -69,6 +70,7 @@ class Election(Base):
             total_candidates: Total number of candidates (optional)
             total_parties: Total number of parties (optional)
             result_status: Result status (DECLARED/PENDING/ONGOING) (optional)
+            flush: Flush now; pass False to leave it to the caller's next flush
 
         Returns:
             Created Election instance
@@ -85,7 +87,8 @@ class Election(Base):
             result_status=result_status,
         )
         session.add(election)
-        session.flush()
+        if flush:
+            session.flush()
         return election
 
     @classmethod
@@ -100,26 +103,59 @@ class Election(Base):
         Returns:
             Election instance or None if not found
         """
-        return session.query(cls).filter(cls.id == election_id).first()
+        return session.get(cls, election_id)
 
     @classmethod
     def get_all(
-        cls, session: Session, skip: int = 0, limit: int = 100
+        cls,
+        session: Session,
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 100,
     ) -> List["Election"]:
         """
-        Get all elections with pagination.
+        Get all elections, most recent first, with keyset pagination.
 
         Args:
             session: Database session
-            skip: Number of records to skip
+            after: (year, id) of the last election on the previous page (None
+                for the first page)
             limit: Maximum number of records to return
 
         Returns:
-            List of Election instances
+            List of Election instances ordered by year, then ID, descending
         """
-        return (
-            session.query(cls).order_by(cls.year.desc()).offset(skip).limit(limit).all()
-        )
+        query = session.query(cls)
+        if after is not None:
+            query = query.filter(tuple_(cls.year, cls.id) < tuple_(*after))
+        return query.order_by(cls.year.desc(), cls.id.desc()).limit(limit).all()
+
+    @classmethod
+    def list_rows(
+        cls,
+        session: Session,
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 100,
+    ) -> List[Row]:
+        """
+        Get elections as plain rows, most recent first, with keyset pagination.
+
+        Same page as get_all, but as Core rows (attribute access by column
+        name) without building ORM instances; for read-only listings.
+
+        Args:
+            session: Database session
+            after: (year, id) of the last election on the previous page (None
+                for the first page)
+            limit: Maximum number of records to return
+
+        Returns:
+            List of rows of the table's columns
+        """
+        stmt = select(cls.__table__)
+        if after is not None:
+            stmt = stmt.where(tuple_(cls.year, cls.id) < tuple_(*after))
+        stmt = stmt.order_by(cls.year.desc(), cls.id.desc()).limit(limit)
+        return session.execute(stmt).all()
 
     @classmethod
     def get_by_year(cls, session: Session, year: int) -> List["Election"]:
@@ -149,65 +185,91 @@ class Election(Base):
         """
         return session.query(cls).filter(cls.type == election_type).all()
 
-    def update(self, session: Session, **kwargs) -> "Election":
+    def update(self, session: Session, flush: bool = False, **kwargs) -> "Election":
         """
         Update election attributes.
 
         Args:
             session: Database session
+            flush: Flush now instead of leaving it to the caller's next
+                flush/commit
             **kwargs: Attributes to update
 
         Returns:
             Updated Election instance
         """
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _MUTABLE_COLUMNS:
                 setattr(self, key, value)
-        session.flush()
+        if flush:
+            session.flush()
         return self
 
-    def delete(self, session: Session) -> None:
+    def delete(self, session: Session, flush: bool = False) -> None:
         """
         Delete this election.
 
         Args:
             session: Database session
+            flush: Flush now instead of leaving it to the caller's next
+                flush/commit
         """
         session.delete(self)
-        session.flush()
+        if flush:
+            session.flush()
 
     @classmethod
-    def bulk_create(cls, session: Session, elections: List[dict]) -> List["Election"]:
+    def bulk_create(
+        cls,
+        session: Session,
+        elections: List[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        drop_indexes: bool = False,
+    ) -> List["Election"]:
         """
         Create multiple elections at once.
 
         Args:
             session: Database session
             elections: List of election dictionaries
+            chunk_size: Rows per execute
+            drop_indexes: Rebuild non-unique indexes once after the load
+                instead of maintaining them; locks the table until commit
+                (see Base.defer_indexes)
 
         Returns:
-            List of created Election instances
+            List of Election instances built from the inserted values (not
+            attached to the session)
         """
-        election_objects = [
-            cls(
-                id=e["election_id"] if "election_id" in e else e["id"],
-                name=e["name"],
-                type=e["type"],
-                year=e["year"],
-                date=e.get("date"),
-                total_constituencies=e.get("total_constituencies"),
-                total_candidates=e.get("total_candidates"),
-                total_parties=e.get("total_parties"),
-                result_status=e.get("result_status"),
-            )
-            for e in elections
-        ]
-        session.bulk_save_objects(election_objects, return_defaults=True)
-        session.flush()
-        return election_objects
+        values = [cls._to_row(e) for e in elections]
+        # Core executemany, batched into multi-row INSERTs (insertmanyvalues);
+        # the ids are client-supplied so nothing needs to be read back
+        with cls.defer_indexes(session, drop_indexes):
+            execute_chunked(session, _INSERT_STMT, values, chunk_size)
+        return [cls(**v) for v in values]
+
+    @staticmethod
+    def _to_row(e: dict) -> dict:
+        """Map an input election dictionary to elections table column values."""
+        return {
+            "id": e.get("election_id", e.get("id")),
+            "name": e["name"],
+            "type": e["type"],
+            "year": e["year"],
+            "total_constituencies": e.get("total_constituencies"),
+            "total_candidates": e.get("total_candidates"),
+            "total_parties": e.get("total_parties"),
+            "result_status": e.get("result_status"),
+        }
 
     @classmethod
-    def bulk_upsert(cls, session: Session, elections: List[dict]) -> int:
+    def bulk_upsert(
+        cls,
+        session: Session,
+        elections: List[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        drop_indexes: bool = False,
+    ) -> int:
         """
         Upsert multiple elections at once (insert if not exists, update if exists).
 
@@ -217,6 +279,10 @@ class Election(Base):
         Args:
             session: Database session
             elections: List of election dictionaries
+            chunk_size: Rows per execute
+            drop_indexes: Rebuild non-unique indexes once after the load
+                instead of maintaining them; locks the table until commit
+                (see Base.defer_indexes)
 
         Returns:
             Number of records processed (inserted or updated)
@@ -225,36 +291,104 @@ class Election(Base):
             return 0
 
         # Prepare data for bulk insert
-        values = []
-        for e in elections:
-            values.append(
-                {
-                    "id": e.get("election_id", e.get("id")),
-                    "name": e["name"],
-                    "type": e["type"],
-                    "year": e["year"],
-                    "total_constituencies": e.get("total_constituencies"),
-                    "total_candidates": e.get("total_candidates"),
-                    "total_parties": e.get("total_parties"),
-                    "result_status": e.get("result_status"),
-                }
-            )
-
-        # Use PostgreSQL's ON CONFLICT DO UPDATE
-        stmt = pg_insert(cls.__table__).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["id"],
-            set_={
-                "name": stmt.excluded.name,
-                "type": stmt.excluded.type,
-                "year": stmt.excluded.year,
-                "total_constituencies": stmt.excluded.total_constituencies,
-                "total_candidates": stmt.excluded.total_candidates,
-                "total_parties": stmt.excluded.total_parties,
-                "result_status": stmt.excluded.result_status,
-            },
-        )
+        values = [cls._to_row(e) for e in elections]
 
-        session.execute(stmt)
+        # Use PostgreSQL's ON CONFLICT DO UPDATE, as one executemany of the
+        # statement built at import
+        with cls.defer_indexes(session, drop_indexes):
+            execute_chunked(session, _UPSERT_STMT, values, chunk_size)
         session.flush()
         return len(elections)
+
+    @classmethod
+    def get_statistics(
+        cls, session: Session, election_id: str
+    ) -> Optional[Dict[str, int]]:
+        """
+        Get precomputed statistics from the election_stats_mv materialized view.
+
+        Args:
+            session: Database session
+            election_id: Election ID
+
+        Returns:
+            Statistics dictionary, or None if the view is unavailable (non-PostgreSQL
+            database, or not created yet) or has no row for this election yet
+        """
+        return cls.get_statistics_bulk(session, [election_id]).get(election_id)
+
+    @classmethod
+    def get_statistics_bulk(
+        cls, session: Session, election_ids: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Get precomputed statistics for several elections in one query.
+
+        Args:
+            session: Database session
+            election_ids: Election IDs
+
+        Returns:
+            Statistics dictionaries keyed by election ID; elections without a view
+            row (or every election when the view does not exist) are omitted
+        """
+        if not election_ids or not cls._statistics_view_exists(session):
+            return {}
+
+        rows = session.execute(
+            text(
+                "SELECT election_id, total_candidates, total_parties, "
+                "total_constituencies, total_winners FROM election_stats_mv "
+                "WHERE election_id IN :election_ids"
+            ).bindparams(bindparam("election_ids", expanding=True)),
+            {"election_ids": list(election_ids)},
+        ).mappings()
+        return {
+            row["election_id"]: {k: v for k, v in row.items() if k != "election_id"}
+            for row in rows
+        }
+
+    @classmethod
+    def refresh_statistics(cls, session: Session) -> None:
+        """
+        Refresh the election_stats_mv materialized view after loading data.
+
+        Uses REFRESH ... CONCURRENTLY so readers are not blocked. No-op when
+        the view does not exist (non-PostgreSQL databases, or tables created
+        with init_db() instead of the Alembic migrations).
+
+        Args:
+            session: Database session
+        """
+        if not cls._statistics_view_exists(session):
+            return
+
+        session.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY election_stats_mv")
+        )
+
+    @staticmethod
+    def _statistics_view_exists(session: Session) -> bool:
+        """Whether election_stats_mv has been created by its migration."""
+        if session.get_bind().dialect.name != "postgresql":
+            return False
+        return (
+            session.scalar(text("SELECT to_regclass('election_stats_mv')")) is not None
+        )
+
+
+_MUTABLE_COLUMNS = mutable_columns(Election.__table__)
+
+_INSERT_STMT = insert(Election.__table__)
+
+# Every column but the primary key is overwritten from the proposed row
+_upsert = pg_insert(Election.__table__)
+_UPSERT_STMT = _upsert.on_conflict_do_update(
+    index_elements=["id"],
+    set_={
+        column.name: _upsert.excluded[column.name]
+        for column in Election.__table__.columns
+        if column.name != "id"
+    },
+)
+del _upsert
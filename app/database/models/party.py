@@ -4,11 +4,11 @@ Party database model with CRUD operations.
 
 from typing import List, Optional
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, Row, String, func, insert, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from ..base import Base
+from ..base import BULK_CHUNK_SIZE, Base, execute_chunked, mutable_columns
 
 
 class Party(Base):
@@ -21,11 +21,16 @@ class Party(Base):
     __tablename__ = "parties"
 
     # Columns
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True)
     name = Column(String, nullable=False, index=True)
-    short_name = Column(String, nullable=False)
+    short_name = Column(String(32), nullable=False)
     symbol = Column(String, default="")
 
+    __table_args__ = (
+        # Serves get_by_name's case-insensitive exact match
+        Index("ix_parties_name_lower", func.lower(name)),
+    )
+
     def __repr__(self) -> str:
         return f"<Party(id={self.id}, name={self.name})>"
 
@@ -33,7 +38,13 @@ class Party(Base):
 
     @classmethod
     def create(
-        cls, session: Session, id: str, name: str, short_name: str, symbol: str = ""
+        cls,
+        session: Session,
+        id: str,
+        name: str,
+        short_name: str,
+        symbol: str = "",
+        flush: bool = True,
     ) -> "Party":
         """
         Create a new party.
@@ -44,6 +55,7 @@ class Party(Base):
             name: Full party name
             short_name: Short party name/abbreviation
             symbol: Party symbol (optional)
+            flush: Flush now; pass False to leave it to the caller's next flush
 
         Returns:
             Created Party instance
@@ -55,7 +67,8 @@ class Party(Base):
             symbol=symbol,
         )
         session.add(party)
-        session.flush()
+        if flush:
+            session.flush()
         return party
 
     @classmethod
@@ -70,7 +83,7 @@ class Party(Base):
         Returns:
             Party instance or None if not found
         """
-        return session.query(cls).filter(cls.id == party_id).first()
+        return session.get(cls, party_id)
 
     @classmethod
     def get_by_name(cls, session: Session, name: str) -> Optional["Party"]:
@@ -84,79 +97,134 @@ class Party(Base):
         Returns:
             Party instance or None if not found
         """
-        return session.query(cls).filter(cls.name.ilike(name)).first()
+        return session.query(cls).filter(func.lower(cls.name) == name.lower()).first()
 
     @classmethod
     def get_all(
-        cls, session: Session, skip: int = 0, limit: int = 100
+        cls, session: Session, after_id: Optional[str] = None, limit: int = 100
     ) -> List["Party"]:
         """
-        Get all parties with pagination.
+        Get all parties with keyset pagination.
 
         Args:
             session: Database session
-            skip: Number of records to skip
+            after_id: ID of the last party on the previous page (None for
+                the first page)
             limit: Maximum number of records to return
 
         Returns:
-            List of Party instances
+            List of Party instances ordered by ID
+        """
+        query = session.query(cls)
+        if after_id is not None:
+            query = query.filter(cls.id > after_id)
+        return query.order_by(cls.id).limit(limit).all()
+
+    @classmethod
+    def list_rows(
+        cls, session: Session, after_id: Optional[str] = None, limit: int = 100
+    ) -> List[Row]:
         """
-        return session.query(cls).offset(skip).limit(limit).all()
+        Get parties as plain rows with pagination.
+
+        Same page as get_all, but as Core rows (attribute access by column
+        name) without building ORM instances; for read-only listings.
 
-    def update(self, session: Session, **kwargs) -> "Party":
+        Args:
+            session: Database session
+            after_id: ID of the last party on the previous page (None for
+                the first page)
+            limit: Maximum number of records to return
+
+        Returns:
+            List of rows of the table's columns, ordered by ID
+        """
+        stmt = select(cls.__table__)
+        if after_id is not None:
+            stmt = stmt.where(cls.id > after_id)
+        return session.execute(stmt.order_by(cls.id).limit(limit)).all()
+
+    def update(self, session: Session, flush: bool = False, **kwargs) -> "Party":
         """
         Update party attributes.
 
         Args:
             session: Database session
+            flush: Flush now instead of leaving it to the caller's next
+                flush/commit
             **kwargs: Attributes to update
 
         Returns:
             Updated Party instance
         """
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _MUTABLE_COLUMNS:
                 setattr(self, key, value)
-        session.flush()
+        if flush:
+            session.flush()
         return self
 
-    def delete(self, session: Session) -> None:
+    def delete(self, session: Session, flush: bool = False) -> None:
         """
         Delete this party.
 
         Args:
             session: Database session
+            flush: Flush now instead of leaving it to the caller's next
+                flush/commit
         """
         session.delete(self)
-        session.flush()
+        if flush:
+            session.flush()
 
     @classmethod
-    def bulk_create(cls, session: Session, parties: List[dict]) -> List["Party"]:
+    def bulk_create(
+        cls,
+        session: Session,
+        parties: List[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        drop_indexes: bool = False,
+    ) -> List["Party"]:
         """
         Create multiple parties at once.
 
         Args:
             session: Database session
             parties: List of party dictionaries
+            chunk_size: Rows per execute
+            drop_indexes: Rebuild non-unique indexes once after the load
+                instead of maintaining them; locks the table until commit
+                (see Base.defer_indexes)
 
         Returns:
-            List of created Party instances
-        """
-        party_objects = [
-            cls(
-                id=p["id"],
-                name=p["name"],
-                short_name=p["short_name"],
-                symbol=p.get("symbol", ""),
-            )
-            for p in parties
-        ]
-        session.bulk_save_objects(party_objects, return_defaults=True)
-        session.flush()
-        return party_objects
+            List of Party instances built from the inserted values (not
+            attached to the session)
+        """
+        values = [cls._to_row(p) for p in parties]
+        # Core executemany, batched into multi-row INSERTs (insertmanyvalues);
+        # the ids are client-supplied so nothing needs to be read back
+        with cls.defer_indexes(session, drop_indexes):
+            execute_chunked(session, _INSERT_STMT, values, chunk_size)
+        return [cls(**v) for v in values]
+
+    @staticmethod
+    def _to_row(p: dict) -> dict:
+        """Map an input party dictionary to parties table column values."""
+        return {
+            "id": p["id"],
+            "name": p["name"],
+            "short_name": p["short_name"],
+            "symbol": p.get("symbol", ""),
+        }
 
     @classmethod
-    def bulk_upsert(cls, session: Session, parties: List[dict]) -> int:
+    def bulk_upsert(
+        cls,
+        session: Session,
+        parties: List[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        drop_indexes: bool = False,
+    ) -> int:
         """
         Upsert multiple parties at once (insert if not exists, update if exists).
 
@@ -166,6 +234,10 @@ class Party(Base):
         Args:
             session: Database session
             parties: List of party dictionaries
+            chunk_size: Rows per execute
+            drop_indexes: Rebuild non-unique indexes once after the load
+                instead of maintaining them; locks the table until commit
+                (see Base.defer_indexes)
 
         Returns:
             Number of records processed (inserted or updated)
@@ -174,27 +246,28 @@ class Party(Base):
             return 0
 
         # Prepare data for bulk insert
-        values = [
-            {
-                "id": p["id"],
-                "name": p["name"],
-                "short_name": p["short_name"],
-                "symbol": p.get("symbol", ""),
-            }
-            for p in parties
-        ]
-
-        # Use PostgreSQL's ON CONFLICT DO UPDATE
-        stmt = pg_insert(cls.__table__).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["id"],
-            set_={
-                "name": stmt.excluded.name,
-                "short_name": stmt.excluded.short_name,
-                "symbol": stmt.excluded.symbol,
-            },
-        )
+        values = [cls._to_row(p) for p in parties]
 
-        session.execute(stmt)
+        # Use PostgreSQL's ON CONFLICT DO UPDATE, as one executemany of the
+        # statement built at import
+        with cls.defer_indexes(session, drop_indexes):
+            execute_chunked(session, _UPSERT_STMT, values, chunk_size)
         session.flush()
         return len(parties)
+
+
+_MUTABLE_COLUMNS = mutable_columns(Party.__table__)
+
+_INSERT_STMT = insert(Party.__table__)
+
+# Every column but the primary key is overwritten from the proposed row
+_upsert = pg_insert(Party.__table__)
+_UPSERT_STMT = _upsert.on_conflict_do_update(
+    index_elements=["id"],
+    set_={
+        column.name: _upsert.excluded[column.name]
+        for column in Party.__table__.columns
+        if column.name != "id"
+    },
+)
+del _upsert
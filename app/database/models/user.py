@@ -2,13 +2,26 @@
 User database model with authentication and onboarding support.
 """
 
-from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, List, Optional, Union
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    exists,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, relationship, selectinload
 
-from ..base import Base
+from ..base import BULK_CHUNK_SIZE, Base, execute_chunked, mutable_columns
 
 
 class User(Base):
@@ -19,23 +32,51 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Unique email; on PostgreSQL it also carries the columns a login
+        # check reads, so get-by-email lookups of them are index-only scans
+        Index(
+            "ix_users_email",
+            "email",
+            unique=True,
+            postgresql_include=["id", "name", "onboarding_completed"],
+        ),
+        # Unique over set usernames only; users who haven't finished
+        # onboarding have none and are left out of the index
+        Index(
+            "ix_users_username",
+            "username",
+            unique=True,
+            postgresql_where=text("username IS NOT NULL"),
+            sqlite_where=text("username IS NOT NULL"),
+        ),
+    )
 
     # Primary identification
-    id = Column(String, primary_key=True, index=True)  # Google user ID
-    email = Column(String, unique=True, nullable=False, index=True)
+    id = Column(String, primary_key=True)  # Google user ID
+    email = Column(String, nullable=False)  # unique, see __table_args__
     name = Column(String, nullable=True)
-    username = Column(String, unique=True, nullable=True, index=True)
+    username = Column(String, nullable=True)  # unique, see __table_args__
     profile_picture = Column(String, nullable=True)
     
     # Onboarding information
     state = Column(String, nullable=True)
     city = Column(String, nullable=True)
-    pincode = Column(String, nullable=True) 
-    age_group = Column(String, nullable=True)
+    pincode = Column(String(10), nullable=True)
+    age_group = Column(String(16), nullable=True)
 
     # Constituency information
     vs_constituency_id = Column(String, ForeignKey("constituencies.id"), nullable=True)
     ls_constituency_id = Column(String, ForeignKey("constituencies.id"), nullable=True)
+
+    # Never lazy-loaded: accessing these without an eager loader raises instead
+    # of silently issuing one SELECT per user (see get_with_constituencies)
+    vs_constituency = relationship(
+        "Constituency", foreign_keys=[vs_constituency_id], lazy="raise"
+    )
+    ls_constituency = relationship(
+        "Constituency", foreign_keys=[ls_constituency_id], lazy="raise"
+    )
     
     # Political preferences
     political_ideology = Column(String, nullable=True)  # e.g., "Rightist", "Leftist", "Communist", "Centrist", "Libertarian", "Neutral"
@@ -44,8 +85,22 @@ class User(Base):
     onboarding_completed = Column(Boolean, default=False, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Set by the database: now() on insert, and now() in every ORM UPDATE.
+    # On PostgreSQL the users_set_updated_at trigger also covers writes made
+    # outside the ORM
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    # Read the server-generated timestamps back with RETURNING on flush
+    # instead of a refresh SELECT when to_dict() touches them
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, name={self.name})>"
@@ -60,6 +115,7 @@ class User(Base):
         email: str,
         name: Optional[str] = None,
         profile_picture: Optional[str] = None,
+        flush: bool = True,
     ) -> "User":
         """
         Create a new user.
@@ -70,6 +126,7 @@ class User(Base):
             email: User email
             name: User's full name
             profile_picture: URL to profile picture
+            flush: Flush now; pass False to leave it to the caller's next flush
 
         Returns:
             Created user object
@@ -82,37 +139,62 @@ class User(Base):
             onboarding_completed=False,
         )
         session.add(user)
-        session.flush()
+        if flush:
+            session.flush()
         return user
 
     @classmethod
     def get_by_id(cls, session: Session, user_id: str) -> Optional["User"]:
         """Get user by ID."""
-        return session.query(cls).filter(cls.id == user_id).first()
+        return session.get(cls, user_id)
+
+    @classmethod
+    def get_with_constituencies(
+        cls, session: Session, user_id: str
+    ) -> Optional["User"]:
+        """Get user by ID with vs_constituency/ls_constituency loaded."""
+        return session.get(
+            cls,
+            user_id,
+            options=[
+                selectinload(cls.vs_constituency),
+                selectinload(cls.ls_constituency),
+            ],
+        )
 
     @classmethod
     def get_by_email(cls, session: Session, email: str) -> Optional["User"]:
         """Get user by email."""
-        return session.query(cls).filter(cls.email == email).first()
+        return session.scalars(select(cls).where(cls.email == email)).one_or_none()
 
     @classmethod
     def get_by_username(cls, session: Session, username: str) -> Optional["User"]:
         """Get user by username."""
-        return session.query(cls).filter(cls.username == username).first()
+        return session.scalars(
+            select(cls).where(cls.username == username)
+        ).one_or_none()
 
     @classmethod
     def is_username_available(cls, session: Session, username: str) -> bool:
         """Check if username is available."""
-        return session.query(cls).filter(cls.username == username).first() is None
+        # SELECT EXISTS(...) returns a single boolean instead of a User row
+        return not session.scalar(select(exists().where(cls.username == username)))
 
     @classmethod
-    def get_all(cls, session: Session) -> List["User"]:
-        """Get all users."""
-        return session.query(cls).all()
+    def get_all(
+        cls, session: Session, after_id: Optional[str] = None, limit: int = 100
+    ) -> List["User"]:
+        """Get users ordered by ID, limit at a time after after_id (keyset)."""
+        query = session.query(cls)
+        if after_id is not None:
+            query = query.filter(cls.id > after_id)
+        return query.order_by(cls.id).limit(limit).all()
 
     def update(
         self,
         session: Session,
+        *,
+        flush: bool = False,
         **kwargs
     ) -> "User":
         """
@@ -120,16 +202,19 @@ class User(Base):
 
         Args:
             session: Database session
+            flush: Flush now rather than at the caller's next flush/commit
+                (get_db_session() commits on exit); needed to read back the
+                server-set updated_at
             **kwargs: Fields to update
 
         Returns:
             Updated user object
         """
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _MUTABLE_COLUMNS:
                 setattr(self, key, value)
-        self.updated_at = datetime.utcnow()
-        session.flush()
+        if flush:
+            session.flush()
         return self
 
     def complete_onboarding(
@@ -139,6 +224,8 @@ class User(Base):
         state: Optional[str] = None,
         city: Optional[str] = None,
         age_group: Optional[str] = None,
+        *,
+        flush: bool = False,
     ) -> "User":
         """
         Complete user onboarding with basic details.
@@ -149,6 +236,7 @@ class User(Base):
             state: State of residence
             city: City of residence
             age_group: Age group
+            flush: Flush now rather than at the caller's next flush/commit
 
         Returns:
             Updated user object
@@ -158,34 +246,171 @@ class User(Base):
         self.city = city
         self.age_group = age_group
         self.onboarding_completed = True
-        self.updated_at = datetime.utcnow()
-        session.flush()
+        if flush:
+            session.flush()
         return self
 
-    def delete(self, session: Session) -> None:
+    def delete(self, session: Session, *, flush: bool = False) -> None:
         """Delete user."""
         session.delete(self)
-        session.flush()
+        if flush:
+            session.flush()
 
     @classmethod
-    def get_by_username(cls, session: Session, username: str) -> Optional["User"]:
-        """Get user by username."""
-        return session.query(cls).filter(cls.username == username).first()
+    def bulk_create(
+        cls,
+        session: Session,
+        users: Iterable[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        returning: bool = True,
+    ) -> Union[List["User"], int]:
+        """
+        Create multiple users at once.
 
-    def to_dict(self) -> dict:
-        """Convert user to dictionary."""
+        users may be any iterable (e.g. a generator over an import file); it is
+        consumed chunk_size rows at a time, each chunk sent as one executemany.
+
+        Args:
+            session: Database session
+            users: User dictionaries
+            chunk_size: Rows per execute
+            returning: Build and return User instances; pass False to return
+                just the number of rows inserted and keep memory bounded
+
+        Returns:
+            List of User instances built from the inserted values (not
+            attached to the session), or the row count if returning is False
+        """
+        created = []
+        count = 0
+        iterator = iter(users)
+        with session.no_autoflush:
+            while values := [cls._to_row(u) for u in islice(iterator, chunk_size)]:
+                session.execute(_INSERT_STMT, values)
+                count += len(values)
+                if returning:
+                    created.extend(cls(**v) for v in values)
+        return created if returning else count
+
+    @staticmethod
+    def _to_row(u: dict) -> dict:
+        """Map an input user dictionary to users table column values."""
+        # Every row carries the same keys so the statements compile once;
+        # created_at/updated_at are left to their server defaults
         return {
-            "id": self.id,
-            "email": self.email,
-            "name": self.name,
-            "username": self.username,
-            "profile_picture": self.profile_picture,
-            "state": self.state,
-            "city": self.city,
-            "pincode": self.pincode,
-            "age_group": self.age_group,
-            "political_ideology": self.political_ideology,
-            "onboarding_completed": self.onboarding_completed,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            **{key: u.get(key) for key in _UPSERT_COLUMNS},
+            "id": u["id"],
+            "email": u["email"],
+            "onboarding_completed": u.get("onboarding_completed", False),
         }
+
+    @classmethod
+    def bulk_upsert(
+        cls,
+        session: Session,
+        users: List[dict],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> int:
+        """
+        Upsert multiple users at once (insert if not exists, update if exists).
+
+        Rows are merged by id (Google user ID); an existing user keeps its
+        email and created_at, every other field is overwritten.
+
+        Args:
+            session: Database session
+            users: List of user dictionaries
+            chunk_size: Rows per execute
+
+        Returns:
+            Number of records processed (inserted or updated)
+        """
+        if not users:
+            return 0
+
+        values = [cls._to_row(u) for u in users]
+        execute_chunked(session, _UPSERT_STMT, values, chunk_size)
+        session.flush()
+        return len(users)
+
+    def to_dict(self) -> dict:
+        """Convert user to dictionary."""
+        return _to_dict(self)
+
+    @classmethod
+    def get_dict(cls, session: Session, user_id: str) -> Optional[dict]:
+        """
+        Get a user as a dictionary (same shape as to_dict).
+
+        Selects only the serialized columns and skips building a User
+        instance.
+        """
+        row = session.execute(
+            select(*_DICT_COLUMNS).where(cls.id == user_id)
+        ).one_or_none()
+        return _to_dict(row) if row is not None else None
+
+    @classmethod
+    def get_id_by_username(cls, session: Session, username: str) -> Optional[str]:
+        """Get the ID of the user holding username, if any."""
+        return session.scalar(select(cls.id).where(cls.username == username))
+
+
+# Columns serialized by to_dict()/get_dict()
+_DICT_COLUMNS = (
+    User.id,
+    User.email,
+    User.name,
+    User.username,
+    User.profile_picture,
+    User.state,
+    User.city,
+    User.pincode,
+    User.age_group,
+    User.political_ideology,
+    User.onboarding_completed,
+    User.created_at,
+    User.updated_at,
+)
+
+
+def _to_dict(user) -> dict:
+    """Serialize a User instance or a row of _DICT_COLUMNS."""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "username": user.username,
+        "profile_picture": user.profile_picture,
+        "state": user.state,
+        "city": user.city,
+        "pincode": user.pincode,
+        "age_group": user.age_group,
+        "political_ideology": user.political_ideology,
+        "onboarding_completed": user.onboarding_completed,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    }
+
+
+_MUTABLE_COLUMNS = mutable_columns(User.__table__)
+
+# Columns bulk_upsert overwrites on conflict; updated_at takes the proposed
+# row's server default (now())
+_UPSERT_COLUMNS = tuple(
+    column.name
+    for column in User.__table__.columns
+    if column.name not in ("id", "email", "created_at", "updated_at")
+)
+
+_INSERT_STMT = insert(User.__table__)
+
+_upsert = pg_insert(User.__table__)
+_UPSERT_STMT = _upsert.on_conflict_do_update(
+    index_elements=["id"],
+    set_={
+        **{name: _upsert.excluded[name] for name in _UPSERT_COLUMNS},
+        "updated_at": _upsert.excluded.updated_at,
+    },
+)
+del _upsert
@@ -4,10 +4,14 @@ Database session management.
 Creates SQLAlchemy engine and session factory.
 """
 
+import os
+
+from flask.globals import app_ctx
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 
-from .config import get_database_url, get_echo_mode
+from .base import BULK_CHUNK_SIZE
+from .config import get_database_url, get_echo_mode, get_engine_options
 
 # Create database engine
 # Works with both local PostgreSQL and Supabase (PostgreSQL-based)
@@ -15,18 +19,41 @@ engine = create_engine(
     get_database_url(),
     echo=get_echo_mode(),
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=5,
-    max_overflow=10,
+    **get_engine_options(),  # Pool sizing/recycling, statement timeout
+    # One multi-VALUES INSERT per execute_chunked() chunk
+    insertmanyvalues_page_size=BULK_CHUNK_SIZE,
+    # Compiled-SQL cache entries (default 500); the models' fixed bulk
+    # statements plus per-endpoint queries should never be evicted
+    query_cache_size=1200,
 )
 
+# Forked workers must not reuse the parent's pooled sockets
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
+
 # Create session factory
+# expire_on_commit=False: get_db_session() commits on exit, and expiring would
+# make every later attribute read on returned objects issue a refresh SELECT
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
 )
 
 
+def _app_context_id() -> int:
+    """Scope RequestSession to the current Flask application context."""
+    return id(app_ctx._get_current_object())
+
+
+# One session per application context, i.e. per request: every
+# get_db_session() block in a request shares its identity map, so an object
+# loaded by one service is returned by session.get() in the next without
+# another SELECT. The app removes it in its teardown_appcontext handler.
+RequestSession = scoped_session(SessionLocal, scopefunc=_app_context_id)
+
+
 def init_db():
     """
     Initialize database tables.
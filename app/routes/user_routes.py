@@ -16,6 +16,12 @@ user_bp = Blueprint("user", __name__, url_prefix="/api/v1/users")
 # Initialize user service
 user_service = UserService()
 
+# Profile fields stored in varchar(n) columns; longer values get a 400
+# instead of failing the UPDATE
+MAX_FIELD_LENGTHS = {
+    key: User.__table__.c[key].type.length for key in ('pincode', 'age_group')
+}
+
 
 # ==================== USER ROUTES ====================
 
@@ -128,6 +134,14 @@ def update_user(user_id):
         for key, value in data.items():
             if key in allowed_fields:
                 update_data[key] = value
+
+        for key, max_length in MAX_FIELD_LENGTHS.items():
+            value = update_data.get(key)
+            if isinstance(value, str) and len(value) > max_length:
+                return jsonify({
+                    'success': False,
+                    'error': f'{key} must be at most {max_length} characters'
+                }), 400
         
         # Update user
         updated_user = user_service.update_user_profile(user_id, **update_data)
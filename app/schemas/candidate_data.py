@@ -1,5 +1,5 @@
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 import re
 
 class EducationDetails(BaseModel):
@@ -8,7 +8,8 @@ class EducationDetails(BaseModel):
     stream: Optional[str] = Field(None, description="Field of study or stream")
     other_details: Optional[str] = Field(None, description="Any other relevant details")
 
-    @validator('year')
+    @field_validator('year')
+    @classmethod
     def validate_year(cls, v):
         if v and not re.match(r'^\d{4}$', str(v)):
             raise ValueError('Year must be a 4-digit number')
@@ -21,7 +22,8 @@ class PoliticalHistory(BaseModel):
     position: Optional[str] = Field(None, description="Position contested for (e.g., MP, MLA)")
     result: Optional[Literal["WON", "LOST"]] = Field(None, description="Result of the election")
 
-    @validator('election_year')
+    @field_validator('election_year')
+    @classmethod
     def validate_year(cls, v):
         if v and not re.match(r'^\d{4}$', str(v)):
             raise ValueError('Year must be a 4-digit number')
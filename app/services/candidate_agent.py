@@ -312,7 +312,7 @@ class CandidateAgent:
         validated_data = []
         for item in data:
             try:
-                validated_data.append(schema(**item).dict())
+                validated_data.append(schema.model_validate(item).model_dump())
             except ValidationError as ve:
                 logger.warning(
                     f"Skipping invalid {data_type} data for {candidate_name} - {item}: {ve}"
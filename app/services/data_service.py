@@ -6,7 +6,7 @@ Implementations can use JSON, database, or any other storage mechanism.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 class DataService(ABC):
@@ -21,20 +21,64 @@ class DataService(ABC):
         """Get a specific election by ID"""
 
     @abstractmethod
-    def get_candidates(self, election_id: str) -> List[Dict[str, Any]]:
-        """Get all candidates for an election"""
+    def get_candidates(
+        self,
+        election_id: str,
+        status: Optional[str] = None,
+        constituency_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        winners_first: bool = False,
+        party_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get all candidates for an election, optionally filtered by status/constituency/party"""
+
+    @abstractmethod
+    def get_candidates_iter(
+        self,
+        election_id: str,
+        status: Optional[str] = None,
+        party_id: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream candidates of an election in chunks instead of loading them all"""
+
+    @abstractmethod
+    def count_candidates(self, election_id: str) -> int:
+        """Count the candidates of an election"""
+
+    @abstractmethod
+    def get_candidates_by_party(
+        self, party_name: str, election_id: str
+    ) -> List[Dict[str, Any]]:
+        """Get all candidates of a party, matched by name or short name"""
+
+    @abstractmethod
+    def enrich_candidate_data(
+        self, candidate: Dict[str, Any], election_id: str
+    ) -> Dict[str, Any]:
+        """Enrich a candidate with party and constituency details"""
+
+    @abstractmethod
+    def enrich_candidates_batch(
+        self, candidates: List[Dict[str, Any]], election_id: str
+    ) -> List[Dict[str, Any]]:
+        """Enrich many candidates with party and constituency details at once"""
 
     @abstractmethod
     def get_parties(self, election_id: str) -> List[Dict[str, Any]]:
         """Get all parties for an election"""
 
+    @abstractmethod
+    def get_parties_with_seats(self, election_id: str) -> List[Dict[str, Any]]:
+        """Get all parties for an election with seats won, most seats first"""
+
     @abstractmethod
     def get_constituencies(self, election_id: str) -> List[Dict[str, Any]]:
-        """Get all constituencies for an election"""
+        """Get all constituencies for an election, ordered by state name and name"""
 
     @abstractmethod
     def search_candidates(
-        self, query: str, election_id: Optional[str] = None
+        self, query: str, election_id: Optional[str] = None, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Search candidates by name, party, or constituency"""
 
@@ -52,6 +96,10 @@ class DataService(ABC):
     def get_party_by_name(self, party_name: str, election_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific party"""
 
+    @abstractmethod
+    def get_state_name(self, state_id: str) -> str:
+        """Get the display name of a state"""
+
     @abstractmethod
     def get_constituency_by_id(
         self, constituency_id: str, election_id: str
@@ -5,30 +5,79 @@ Reads data from the database using SQLAlchemy models.
 Works with both local PostgreSQL and Supabase.
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlalchemy import func
+from cachetools import TTLCache
+from sqlalchemy import case, func, or_, select
 
 from app.database import get_db_session
 from app.database.models import Candidate as DbCandidate
+from app.database.models import CandidateStatus
 from app.database.models import Constituency as DbConstituency
 from app.database.models import Election as DbElection
 from app.database.models import Party as DbParty
 
 from .data_service import DataService
 
+# ECI state/UT codes used by constituencies and candidates
+STATE_NAMES: Dict[str, str] = {
+    "S01": "Andhra Pradesh",
+    "S02": "Arunachal Pradesh",
+    "S03": "Assam",
+    "S04": "Bihar",
+    "S05": "Goa",
+    "S06": "Gujarat",
+    "S07": "Haryana",
+    "S08": "Himachal Pradesh",
+    "S10": "Karnataka",
+    "S11": "Kerala",
+    "S12": "Madhya Pradesh",
+    "S13": "Maharashtra",
+    "S14": "Manipur",
+    "S15": "Meghalaya",
+    "S16": "Mizoram",
+    "S17": "Nagaland",
+    "S18": "Odisha",
+    "S19": "Punjab",
+    "S20": "Rajasthan",
+    "S21": "Sikkim",
+    "S22": "Tamil Nadu",
+    "S23": "Tripura",
+    "S24": "Uttar Pradesh",
+    "S25": "West Bengal",
+    "S26": "Chhattisgarh",
+    "S27": "Jharkhand",
+    "S28": "Uttarakhand",
+    "S29": "Telangana",
+    "U01": "Andaman & Nicobar Islands",
+    "U02": "Chandigarh",
+    "U03": "Dadra & Nagar Haveli and Daman & Diu",
+    "U05": "NCT of Delhi",
+    "U06": "Lakshadweep",
+    "U07": "Puducherry",
+    "U08": "Jammu and Kashmir",
+    "U09": "Ladakh",
+}
+
 
 class DbDataService(DataService):
     """Database-backed data service implementation"""
 
     def __init__(self):
         self._elections_cache = None
+        # Elections are near-immutable reference data looked up on almost every
+        # request, so keep them for a few minutes instead of re-querying
+        self._election_cache: TTLCache = TTLCache(maxsize=64, ttl=600)
+        # Parties by lowercased name; small reference data, refreshed every 5 min
+        self._party_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        self._cache_lock = threading.Lock()
 
     def get_elections(self) -> List[Dict[str, Any]]:
         """Get all available elections from database"""
         if self._elections_cache is None:
             with get_db_session() as session:
-                db_elections = DbElection.get_all(session, skip=0, limit=1000)
+                db_elections = DbElection.list_rows(session, limit=1000)
                 self._elections_cache = [
                     {
                         "id": e.id,
@@ -41,58 +90,213 @@ class DbDataService(DataService):
         return self._elections_cache
 
     def get_election(self, election_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific election by ID from database"""
+        """Get a specific election by ID (cached for ten minutes)"""
+        with self._cache_lock:
+            election = self._election_cache.get(election_id)
+        if election is not None:
+            return election
+
         with get_db_session() as session:
             db_election = DbElection.get_by_id(session, election_id)
-            if db_election:
-                return {
-                    "id": db_election.id,
-                    "name": db_election.name,
-                    "type": db_election.type,
-                    "year": db_election.year,
-                }
-        return None
+            if not db_election:
+                return None
+            election = {
+                "id": db_election.id,
+                "name": db_election.name,
+                "type": db_election.type,
+                "year": db_election.year,
+            }
+
+        with self._cache_lock:
+            self._election_cache[election_id] = election
+        return election
+
+    def get_state_name(self, state_id: str) -> str:
+        """Get the state/UT name for an ECI state code (e.g. "S01")"""
+        return STATE_NAMES.get(state_id, state_id)
+
+    def get_candidates(
+        self,
+        election_id: str,
+        status: Optional[str] = None,
+        constituency_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        winners_first: bool = False,
+        party_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all candidates for an election.
 
-    def get_candidates(self, election_id: str) -> List[Dict[str, Any]]:
-        """Get all candidates for an election"""
+        Args:
+            election_id: Election ID
+            status: Only return candidates with this status (e.g. "WON")
+            constituency_id: Only return candidates from this constituency
+            party_id: Only return candidates of this party
+            limit: Maximum number of candidates to return
+            winners_first: Order WON candidates first, then by name, instead of by ID
+
+        Returns:
+            List of candidate dictionaries
+        """
         # Verify election exists
         election = self.get_election(election_id)
         if not election:
             return []
 
         with get_db_session() as session:
-            db_candidates = DbCandidate.get_all(session, skip=0, limit=10000)
-            
-            if not db_candidates:
-                return []
-            
-            # Batch load parties and constituencies to avoid N+1 queries
-            party_ids = {c.party_id for c in db_candidates}
-            constituency_ids = {c.constituency_id for c in db_candidates}
-            
-            # Load all parties and constituencies in one query each
-            # Handle empty sets to avoid SQLAlchemy errors
-            parties = {}
-            if party_ids:
-                parties = {
-                    p.id: p 
-                    for p in session.query(DbParty).filter(DbParty.id.in_(party_ids)).all()
-                }
-            
-            constituencies = {}
-            if constituency_ids:
-                constituencies = {
-                    c.id: c 
-                    for c in session.query(DbConstituency)
-                    .filter(DbConstituency.id.in_(constituency_ids))
-                    .all()
-                }
-            
-            # Convert to dict format for API compatibility using caches
-            return [
-                self._candidate_to_dict(c, session, election_id, parties, constituencies)
-                for c in db_candidates
-            ]
+            # Filter in SQL so only the requested rows are loaded
+            query = session.query(DbCandidate)
+            if status:
+                query = query.filter(DbCandidate.status == status)
+            if constituency_id:
+                query = query.filter(DbCandidate.constituency_id == constituency_id)
+            if party_id:
+                query = query.filter(DbCandidate.party_id == party_id)
+            if winners_first:
+                query = query.order_by(
+                    case((DbCandidate.status == CandidateStatus.WON, 0), else_=1), DbCandidate.name
+                )
+            else:
+                query = query.order_by(DbCandidate.id)
+            db_candidates = query.limit(limit or 10000).all()
+
+            return self._candidates_to_dicts(db_candidates, session, election_id)
+
+    def get_candidates_iter(
+        self,
+        election_id: str,
+        status: Optional[str] = None,
+        party_id: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream candidates of an election without loading the full list.
+
+        Rows are fetched through a server-side cursor chunk_size at a time, and
+        related parties/constituencies are batch-loaded per chunk.
+
+        Args:
+            election_id: Election ID
+            status: Only yield candidates with this status (e.g. "WON")
+            party_id: Only yield candidates of this party
+            chunk_size: Number of rows fetched per round-trip
+
+        Yields:
+            Candidate dictionaries
+        """
+        # Verify election exists
+        election = self.get_election(election_id)
+        if not election:
+            return
+
+        with get_db_session() as session:
+            stmt = select(DbCandidate).order_by(DbCandidate.id)
+            if status:
+                stmt = stmt.where(DbCandidate.status == status)
+            if party_id:
+                stmt = stmt.where(DbCandidate.party_id == party_id)
+            result = session.scalars(stmt.execution_options(yield_per=chunk_size))
+
+            for chunk in result.partitions():
+                yield from self._candidates_to_dicts(chunk, session, election_id)
+
+    def get_candidates_by_party(
+        self, party_name: str, election_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all candidates of a party, matched by name or short name.
+
+        Args:
+            party_name: Party name or short name (case-insensitive)
+            election_id: Election ID
+
+        Returns:
+            List of candidate dictionaries
+        """
+        # Verify election exists
+        election = self.get_election(election_id)
+        if not election:
+            return []
+
+        party_name = party_name.lower()
+        with get_db_session() as session:
+            db_candidates = (
+                session.query(DbCandidate)
+                .join(DbParty, DbParty.id == DbCandidate.party_id)
+                .filter(
+                    or_(
+                        func.lower(DbParty.name) == party_name,
+                        func.lower(DbParty.short_name) == party_name,
+                    )
+                )
+                .all()
+            )
+
+            return self._candidates_to_dicts(db_candidates, session, election_id)
+
+    def enrich_candidate_data(
+        self, candidate: Dict[str, Any], election_id: str
+    ) -> Dict[str, Any]:
+        """Enrich a single candidate dictionary with party and constituency details"""
+        return self.enrich_candidates_batch([candidate], election_id)[0]
+
+    def enrich_candidates_batch(
+        self, candidates: List[Dict[str, Any]], election_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Enrich candidate dictionaries with party and constituency details.
+
+        Candidates already converted by _candidate_to_dict are returned as-is.
+        For the rest, parties and constituencies are loaded with one
+        WHERE id IN (...) query each and joined by dict lookup.
+
+        Args:
+            candidates: Candidate dictionaries with party_id and constituency_id
+            election_id: Election ID
+
+        Returns:
+            List of enriched candidate dictionaries, in the input order
+        """
+        pending = [
+            c for c in candidates if "party_name" not in c or "constituency_name" not in c
+        ]
+        if not pending:
+            return candidates
+
+        party_ids = {c.get("party_id") for c in pending}
+        constituency_ids = {c.get("constituency_id") for c in pending}
+
+        with get_db_session() as session:
+            parties = {
+                p.id: p
+                for p in session.query(DbParty).filter(DbParty.id.in_(party_ids)).all()
+            }
+            constituencies = {
+                c.id: c
+                for c in session.query(DbConstituency)
+                .filter(DbConstituency.id.in_(constituency_ids))
+                .all()
+            }
+
+            enriched = []
+            for candidate in candidates:
+                if "party_name" in candidate and "constituency_name" in candidate:
+                    enriched.append(candidate)
+                    continue
+
+                party = parties.get(candidate.get("party_id"))
+                constituency = constituencies.get(candidate.get("constituency_id"))
+                enriched.append({
+                    **candidate,
+                    "party_name": party.name if party else "Unknown",
+                    "party_short_name": party.short_name if party else "UNK",
+                    "party_symbol": party.symbol if party else "",
+                    "constituency_name": constituency.name if constituency else "Unknown",
+                    "constituency_state_id": constituency.state_id if constituency else "",
+                    "state_name": self.get_state_name(candidate.get("state_id", "")),
+                    "election_id": election_id,
+                })
+            return enriched
 
     def get_parties(self, election_id: str) -> List[Dict[str, Any]]:
         """Get all parties for an election"""
@@ -102,7 +306,7 @@ class DbDataService(DataService):
             return []
 
         with get_db_session() as session:
-            db_parties = DbParty.get_all(session, skip=0, limit=10000)
+            db_parties = DbParty.list_rows(session, limit=10000)
             # Convert to dictionaries
             return [
                 {
@@ -114,15 +318,66 @@ class DbDataService(DataService):
                 for p in db_parties
             ]
 
+    def get_parties_with_seats(self, election_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all parties for an election with their seats won, most seats first.
+
+        Seats are counted by a GROUP BY over winning candidates joined to
+        parties, so no candidate rows are loaded.
+        """
+        # Verify election exists
+        election = self.get_election(election_id)
+        if not election:
+            return []
+
+        with get_db_session() as session:
+            seats = (
+                session.query(
+                    DbCandidate.party_id.label("party_id"),
+                    func.count(DbCandidate.id).label("seats_won"),
+                )
+                .filter(DbCandidate.status == CandidateStatus.WON)
+                .group_by(DbCandidate.party_id)
+                .subquery()
+            )
+            seats_won = func.coalesce(seats.c.seats_won, 0)
+            rows = (
+                session.query(DbParty, seats_won)
+                .outerjoin(seats, seats.c.party_id == DbParty.id)
+                .order_by(seats_won.desc(), DbParty.name)
+                .all()
+            )
+            return [
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "short_name": p.short_name,
+                    "symbol": p.symbol,
+                    "seats_won": won,
+                }
+                for p, won in rows
+            ]
+
     def get_constituencies(self, election_id: str) -> List[Dict[str, Any]]:
-        """Get all constituencies for an election"""
+        """Get all constituencies for an election, ordered by state name and name"""
         # Verify election exists
         election = self.get_election(election_id)
         if not election:
             return []
 
         with get_db_session() as session:
-            db_constituencies = DbConstituency.get_all(session, skip=0, limit=10000)
+            # There is no states table, so map state codes to names in the
+            # ORDER BY itself and let the database do the sort
+            state_name = case(
+                STATE_NAMES, value=DbConstituency.state_id, else_=DbConstituency.state_id
+            )
+            db_constituencies = session.execute(
+                select(
+                    DbConstituency.id, DbConstituency.name, DbConstituency.state_id
+                )
+                .order_by(state_name, DbConstituency.name)
+                .limit(10000)
+            ).all()
             # Convert to dictionaries
             return [
                 {
@@ -133,8 +388,18 @@ class DbDataService(DataService):
                 for c in db_constituencies
             ]
 
+    def count_candidates(self, election_id: str) -> int:
+        """Count the candidates of an election with a single COUNT query"""
+        # Verify election exists
+        election = self.get_election(election_id)
+        if not election:
+            return 0
+
+        with get_db_session() as session:
+            return session.query(func.count(DbCandidate.id)).scalar() or 0
+
     def search_candidates(
-        self, query: str, election_id: Optional[str] = None
+        self, query: str, election_id: Optional[str] = None, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Search candidates by name, party, or constituency"""
         # If election_id is provided, verify it exists
@@ -145,7 +410,7 @@ class DbDataService(DataService):
 
         with get_db_session() as session:
             # Search by name
-            db_candidates = DbCandidate.search_by_name(session, query)
+            db_candidates = DbCandidate.search_by_name(session, query, limit=limit)
             # Get all elections to determine election_id for each candidate
             # For now, we'll use the first election if election_id not provided
             if not election_id:
@@ -185,22 +450,32 @@ class DbDataService(DataService):
             return self._candidate_to_dict(db_candidate, session, election_id, include_details=True)
 
     def get_party_by_name(self, party_name: str, election_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific party"""
+        """Get a specific party (cached for five minutes)"""
         # Verify election exists
         election = self.get_election(election_id)
         if not election:
             return None
 
+        cache_key = party_name.lower()
+        with self._cache_lock:
+            party = self._party_cache.get(cache_key)
+        if party is not None:
+            return party
+
         with get_db_session() as session:
             db_party = DbParty.get_by_name(session, party_name)
-            if db_party:
-                return {
-                    "id": db_party.id,
-                    "name": db_party.name,
-                    "short_name": db_party.short_name,
-                    "symbol": db_party.symbol,
-                }
-            return None
+            if not db_party:
+                return None
+            party = {
+                "id": db_party.id,
+                "name": db_party.name,
+                "short_name": db_party.short_name,
+                "symbol": db_party.symbol,
+            }
+
+        with self._cache_lock:
+            self._party_cache[cache_key] = party
+        return party
 
     def get_constituency_by_id(
         self, constituency_id: str, election_id: str
@@ -223,29 +498,57 @@ class DbDataService(DataService):
 
     def get_election_statistics(self, election_id: str) -> Dict[str, int]:
         """
-        Get statistics for an election using efficient COUNT queries.
-        This avoids fetching all records when we only need counts.
+        Get statistics for an election.
+
+        Reads the precomputed election_stats_mv row when available and falls
+        back to efficient COUNT queries otherwise.
         """
-        with get_db_session() as session:
-            # Use COUNT queries instead of fetching all records
-            total_candidates = session.query(func.count(DbCandidate.id)).scalar() or 0
-            total_winners = (
-                session.query(func.count(DbCandidate.id))
-                .filter(DbCandidate.status == "WON")
-                .scalar()
-                or 0
-            )
-            total_parties = session.query(func.count(func.distinct(DbParty.id))).scalar() or 0
-            total_constituencies = (
-                session.query(func.count(func.distinct(DbConstituency.id))).scalar() or 0
-            )
+        return self.get_election_statistics_bulk([election_id])[election_id]
 
-            return {
-                "total_candidates": total_candidates,
-                "total_parties": total_parties,
-                "total_constituencies": total_constituencies,
-                "total_winners": total_winners,
-            }
+    def get_election_statistics_bulk(
+        self, election_ids: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Get statistics for several elections in one round-trip.
+
+        Returns:
+            Statistics dictionaries keyed by election ID
+        """
+        with get_db_session() as session:
+            # Served from the election_stats_mv materialized view on PostgreSQL
+            stats = DbElection.get_statistics_bulk(session, election_ids)
+            missing = [eid for eid in election_ids if eid not in stats]
+            if missing:
+                # Counts are table-wide, so one query covers every missing election
+                counts = self._count_election_statistics(session)
+                stats.update({eid: dict(counts) for eid in missing})
+            return stats
+
+    @staticmethod
+    def _count_election_statistics(session) -> Dict[str, int]:
+        """Compute election statistics with live COUNT queries"""
+        # All four counts in one round-trip; winners come from a filtered
+        # aggregate over the same scan instead of a second COUNT query
+        party_count = select(func.count(DbParty.id)).scalar_subquery()
+        constituency_count = select(func.count(DbConstituency.id)).scalar_subquery()
+        (
+            total_candidates,
+            total_winners,
+            total_parties,
+            total_constituencies,
+        ) = session.query(
+            func.count(DbCandidate.id),
+            func.count(DbCandidate.id).filter(DbCandidate.status == CandidateStatus.WON),
+            party_count,
+            constituency_count,
+        ).one()
+
+        return {
+            "total_candidates": total_candidates or 0,
+            "total_parties": total_parties or 0,
+            "total_constituencies": total_constituencies or 0,
+            "total_winners": total_winners or 0,
+        }
 
     def get_party_seat_counts(self, election_id: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
@@ -259,7 +562,7 @@ class DbDataService(DataService):
                     DbCandidate.party_id,
                     func.count(DbCandidate.id).label("seats_won")
                 )
-                .filter(DbCandidate.status == "WON")
+                .filter(DbCandidate.status == CandidateStatus.WON)
                 .group_by(DbCandidate.party_id)
                 .order_by(func.count(DbCandidate.id).desc())
                 .limit(limit)
@@ -294,6 +597,35 @@ class DbDataService(DataService):
             
             return result
 
+    def _candidates_to_dicts(
+        self, db_candidates: List[DbCandidate], session, election_id: str
+    ) -> List[Dict[str, Any]]:
+        """Convert database candidates to dictionaries, batch-loading related rows."""
+        if not db_candidates:
+            return []
+
+        # Batch load parties and constituencies to avoid N+1 queries
+        party_ids = {c.party_id for c in db_candidates}
+        constituency_ids = {c.constituency_id for c in db_candidates}
+
+        # Load all parties and constituencies in one query each
+        parties = {
+            p.id: p
+            for p in session.query(DbParty).filter(DbParty.id.in_(party_ids)).all()
+        }
+        constituencies = {
+            c.id: c
+            for c in session.query(DbConstituency)
+            .filter(DbConstituency.id.in_(constituency_ids))
+            .all()
+        }
+
+        # Convert to dict format for API compatibility using caches
+        return [
+            self._candidate_to_dict(c, session, election_id, parties, constituencies)
+            for c in db_candidates
+        ]
+
     def _candidate_to_dict(
         self, candidate: DbCandidate, session, election_id: str, 
         party_cache: Optional[Dict[str, DbParty]] = None,
@@ -343,6 +675,7 @@ class DbDataService(DataService):
             "constituency_name": constituency_name,
             "constituency_state_id": constituency_state_id,
             "state_id": candidate.state_id,
+            "state_name": self.get_state_name(candidate.state_id),
             "status": candidate.status,
             "type": candidate.type,
             "image_url": candidate.image_url,
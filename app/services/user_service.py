@@ -49,12 +49,14 @@ class UserService:
                     profile_picture=picture
                 )
             else:
-                # Update profile picture if changed
+                # Update profile picture and name if changed, in one flush
+                changes = {}
                 if picture and user.profile_picture != picture:
-                    user.update(session, profile_picture=picture)
-                # Update name if changed
+                    changes['profile_picture'] = picture
                 if name and user.name != name:
-                    user.update(session, name=name)
+                    changes['name'] = name
+                if changes:
+                    user.update(session, flush=True, **changes)
             
             return user.to_dict()
 
@@ -69,8 +71,7 @@ class UserService:
             User dictionary or None if not found
         """
         with get_db_session() as session:
-            user = User.get_by_id(session, user_id)
-            return user.to_dict() if user else None
+            return User.get_dict(session, user_id)
 
     def update_user_profile(
         self,
@@ -97,7 +98,8 @@ class UserService:
             # For simplicity, we assume controller checked availability.
             
             # Update fields
-            user.update(session, **kwargs)
+            # Flush so to_dict() sees the server-set updated_at
+            user.update(session, flush=True, **kwargs)
             return user.to_dict()
 
     def check_username_available(self, username: str, exclude_user_id: Optional[str] = None) -> bool:
@@ -112,10 +114,10 @@ class UserService:
             True if username is available, False otherwise
         """
         with get_db_session() as session:
-            user = User.get_by_username(session, username)
-            if not user:
+            owner_id = User.get_id_by_username(session, username)
+            if not owner_id:
                 return True
             # If checking for a specific user, allow them to keep their own username
-            if exclude_user_id and user.id == exclude_user_id:
+            if exclude_user_id and owner_id == exclude_user_id:
                 return True
             return False
@@ -24,7 +24,7 @@ from typing import Any, Dict, List
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.database import get_db_session, init_db
-from app.database.models import Candidate, Constituency, Party
+from app.database.models import Candidate, Constituency, Election, Party
 
 
 def load_json_file(file_path: Path) -> List[Dict[str, Any]]:
@@ -236,6 +236,11 @@ def migrate_election_data(election_dir: Path, dry_run: bool = False):
             total_migrated += migrate_constituencies(session, constituencies_data)
             total_migrated += migrate_candidates(session, candidates_data)
 
+        # Recompute the cached per-election statistics once the load has
+        # committed, so a failed refresh cannot roll the data back
+        with get_db_session() as session:
+            Election.refresh_statistics(session)
+
         print(f"\n{'='*60}")
         print(f"Migration Complete!")
         print(f"Total records migrated: {total_migrated}")
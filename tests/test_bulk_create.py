@@ -0,0 +1,118 @@
+"""
+Tests for the models' Core bulk_create paths against in-memory SQLite.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+
+from app.database.base import Base
+from app.database.models import Candidate, CandidateStatus, Election, Party
+
+
+@pytest.fixture
+def engine():
+    """In-memory database with the tables under test."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[Candidate.__table__, Election.__table__, Party.__table__]
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """Session on the in-memory database."""
+    with Session(engine) as session:
+        yield session
+
+
+def _record_statements(engine):
+    """Collect (statement, executemany) for every execute on engine."""
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, params, context, executemany: (
+            statements.append((statement, executemany))
+        ),
+    )
+    return statements
+
+
+def test_party_bulk_create(session, engine):
+    """Parties are inserted with one executemany per chunk."""
+    parties = [
+        {"id": f"P{i}", "name": f"Party {i}", "short_name": f"P{i}"}
+        for i in range(5)
+    ]
+    statements = _record_statements(engine)
+
+    created = Party.bulk_create(session, parties, chunk_size=2)
+
+    assert [executemany for _, executemany in statements] == [True, True, False]
+    assert [p.id for p in created] == ["P0", "P1", "P2", "P3", "P4"]
+    rows = session.execute(select(Party.id, Party.symbol).order_by(Party.id)).all()
+    assert rows == [(f"P{i}", "") for i in range(5)]
+
+
+def test_election_bulk_create(session):
+    """Election rows accept election_id or id and keep the optional totals."""
+    Election.bulk_create(
+        session,
+        [
+            {
+                "election_id": "lok-sabha-2024",
+                "name": "Lok Sabha 2024",
+                "type": "LOK_SABHA",
+                "year": 2024,
+                "total_candidates": 8360,
+            },
+            {
+                "id": "delhi-2025",
+                "name": "Delhi 2025",
+                "type": "VIDHAN_SABHA",
+                "year": 2025,
+            },
+        ],
+    )
+
+    rows = session.execute(
+        select(Election.id, Election.year, Election.total_candidates).order_by(
+            Election.id
+        )
+    ).all()
+    assert rows == [("delhi-2025", 2025, None), ("lok-sabha-2024", 2024, 8360)]
+
+
+def test_candidate_bulk_create(session, engine):
+    """Candidates are inserted by Core executemany, nothing is read back."""
+    candidates = [
+        {
+            "id": f"C{i}",
+            "name": f"Candidate {i}",
+            "party_id": "P1",
+            "constituency_id": "1",
+            "constituency_unique_id": "1-S04",
+            "state_id": "S04",
+            "status": "WON" if i == 0 else "LOST",
+            "assets": {"total": i},
+        }
+        for i in range(3)
+    ]
+    statements = _record_statements(engine)
+
+    created = Candidate.bulk_create(session, candidates)
+
+    assert len(statements) == 1
+    assert "RETURNING" not in statements[0][0].upper()
+    assert [c.id for c in created] == ["C0", "C1", "C2"]
+    row = session.execute(
+        select(Candidate.__table__).where(Candidate.id == "C0")
+    ).one()
+    assert row.constituency_id == "1-S04"
+    assert row.original_constituency_id == "1"
+    assert row.status is CandidateStatus.WON
+    assert row.assets == {"total": 0}
+    assert row.created_at is not None
@@ -0,0 +1,94 @@
+"""
+Tests for CandidateController with a stub data service.
+"""
+
+import sys
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+# Mock chromadb before importing to avoid numpy compatibility issues in tests
+sys.modules['chromadb'] = MagicMock()
+sys.modules['chromadb.config'] = MagicMock()
+
+from app.controllers.candidate_controller import CandidateController
+
+
+@pytest.fixture
+def data_service():
+    """Stub data service with one election; enrichment passes rows through."""
+    service = Mock()
+    service.get_election.return_value = {
+        "id": "lok-sabha-2024",
+        "name": "Lok Sabha 2024",
+    }
+    service.enrich_candidates_batch.side_effect = lambda candidates, _: list(
+        candidates
+    )
+    return service
+
+
+@pytest.fixture
+def controller(data_service):
+    """CandidateController backed by the stub data service."""
+    controller = CandidateController()
+    controller.data_service = data_service
+    return controller
+
+
+def test_winning_candidates(controller, data_service):
+    """Winners are fetched with a status filter and labelled with the election."""
+    data_service.get_candidates.return_value = [{"id": "1", "status": "WON"}]
+
+    result = controller.get_winning_candidates("lok-sabha-2024")
+
+    data_service.get_candidates.assert_called_once_with(
+        "lok-sabha-2024", status="WON"
+    )
+    assert result == {
+        "election_id": "lok-sabha-2024",
+        "election_name": "Lok Sabha 2024",
+        "total_winners": 1,
+        "winners": [{"id": "1", "status": "WON"}],
+    }
+
+
+def test_winning_candidates_unknown_election(controller, data_service):
+    """An unknown election has no winners and no candidates query."""
+    data_service.get_election.return_value = None
+
+    result = controller.get_winning_candidates("nope")
+
+    assert result["total_winners"] == 0
+    data_service.get_candidates.assert_not_called()
+
+
+def test_candidates_by_election_limited(controller, data_service):
+    """With a limit, only the page is fetched and the total is counted in SQL."""
+    data_service.get_candidates.return_value = [{"id": "1"}, {"id": "2"}]
+    data_service.count_candidates.return_value = 540
+
+    result = controller.get_candidates_by_election("lok-sabha-2024", limit=2)
+
+    data_service.get_candidates.assert_called_once_with("lok-sabha-2024", limit=2)
+    assert result["election_name"] == "Lok Sabha 2024"
+    assert result["total_candidates"] == 540
+    assert result["showing"] == 2
+
+
+def test_candidates_by_election_unlimited(controller, data_service):
+    """Without a limit, the total is the number of candidates returned."""
+    data_service.get_candidates.return_value = [{"id": "1"}]
+
+    result = controller.get_candidates_by_election("lok-sabha-2024")
+
+    data_service.count_candidates.assert_not_called()
+    assert result["total_candidates"] == 1
+    assert result["candidates"] == [{"id": "1"}]
+
+
+def test_candidates_by_election_unknown_election(controller, data_service):
+    """An unknown election returns None."""
+    data_service.get_election.return_value = None
+
+    assert controller.get_candidates_by_election("nope") is None
@@ -0,0 +1,64 @@
+"""
+Tests for Candidate.search_by_name against an in-memory SQLite database.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.database.models import Candidate
+from app.database.models.candidate import SEARCH_RESULTS_LIMIT
+
+
+@pytest.fixture
+def session():
+    """Session on a fresh in-memory database with only the candidates table."""
+    engine = create_engine("sqlite://")
+    Candidate.__table__.create(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _add_candidates(session, names):
+    session.add_all(
+        Candidate(
+            id=str(i),
+            name=name,
+            party_id="P1",
+            constituency_id="DL-1",
+            state_id="DL",
+            status="LOST",
+        )
+        for i, name in enumerate(names)
+    )
+    session.flush()
+
+
+def test_search_by_name_treats_wildcards_literally(session):
+    """A % or _ in the search term does not match every candidate."""
+    _add_candidates(session, ["Rahul Gandhi", "Narendra Modi", "100% Kumar"])
+
+    assert [c.name for c in Candidate.search_by_name(session, "%")] == [
+        "100% Kumar"
+    ]
+    assert Candidate.search_by_name(session, "_") == []
+
+
+def test_search_by_name_is_case_insensitive(session):
+    """Partial, case-insensitive matches are returned ordered by name."""
+    _add_candidates(session, ["Rahul Gandhi", "Sonia Gandhi", "Narendra Modi"])
+
+    results = Candidate.search_by_name(session, "GANDHI")
+
+    assert [c.name for c in results] == ["Rahul Gandhi", "Sonia Gandhi"]
+
+
+def test_search_by_name_caps_results_by_default(session):
+    """Without a limit, results stop at SEARCH_RESULTS_LIMIT."""
+    _add_candidates(
+        session, [f"Candidate {i:04d}" for i in range(SEARCH_RESULTS_LIMIT + 5)]
+    )
+
+    assert len(Candidate.search_by_name(session, "candidate")) == SEARCH_RESULTS_LIMIT
+    assert len(Candidate.search_by_name(session, "candidate", limit=3)) == 3
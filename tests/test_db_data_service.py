@@ -0,0 +1,179 @@
+"""
+Tests for DbDataService queries against an in-memory SQLite database.
+"""
+
+import sys
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# Mock chromadb before importing to avoid numpy compatibility issues in tests
+sys.modules['chromadb'] = MagicMock()
+sys.modules['chromadb.config'] = MagicMock()
+
+from app.database.base import Base
+from app.database.models import Candidate, Constituency, Election, Party
+from app.services.db_data_service import DbDataService
+
+ELECTION_ID = "lok-sabha-2024"
+
+
+@pytest.fixture
+def engine():
+    """In-memory database with the election data tables."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            Election.__table__,
+            Party.__table__,
+            Constituency.__table__,
+            Candidate.__table__,
+        ],
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def service(engine):
+    """DbDataService whose get_db_session() uses the in-memory database."""
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    @contextmanager
+    def db_session():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    with factory() as session:
+        session.add_all(
+            [
+                Election(
+                    id=ELECTION_ID, name="Lok Sabha 2024", type="LOK_SABHA", year=2024
+                ),
+                Party(id="P1", name="Alpha Party", short_name="AP", symbol="Lamp"),
+                Party(id="P2", name="Beta Party", short_name="BP", symbol="Tree"),
+                Party(id="P3", name="Gamma Party", short_name="GP", symbol="Kite"),
+                Constituency(
+                    id="C1", original_id="1", name="North", state_id="S04", type="LS"
+                ),
+                Constituency(
+                    id="C2", original_id="2", name="South", state_id="S04", type="LS"
+                ),
+            ]
+        )
+        session.commit()
+
+    with patch("app.services.db_data_service.get_db_session", db_session):
+        yield DbDataService()
+
+
+def _record_statements(engine):
+    """Collect the SQL statements executed on engine."""
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def test_enrich_candidates_batch(service, engine):
+    """Parties and constituencies are joined in with one query each."""
+    candidates = [
+        {"id": "1", "party_id": "P1", "constituency_id": "C1", "state_id": "S04"},
+        {"id": "2", "party_id": "P2", "constituency_id": "C2", "state_id": "S04"},
+        {"id": "3", "party_id": "P1", "constituency_id": "C2", "state_id": "S04"},
+    ]
+    statements = _record_statements(engine)
+
+    enriched = service.enrich_candidates_batch(candidates, ELECTION_ID)
+
+    assert len(statements) == 2
+    assert [c["id"] for c in enriched] == ["1", "2", "3"]
+    assert enriched[0]["party_name"] == "Alpha Party"
+    assert enriched[0]["party_short_name"] == "AP"
+    assert enriched[0]["party_symbol"] == "Lamp"
+    assert enriched[0]["constituency_name"] == "North"
+    assert enriched[1]["party_name"] == "Beta Party"
+    assert enriched[2]["constituency_name"] == "South"
+    assert enriched[2]["state_name"] == "Bihar"
+    assert enriched[2]["election_id"] == ELECTION_ID
+
+
+def test_enrich_candidates_batch_unknown_references(service):
+    """Missing parties and constituencies fall back to placeholder values."""
+    enriched = service.enrich_candidates_batch(
+        [{"id": "1", "party_id": "P9", "constituency_id": "C9", "state_id": "S04"}],
+        ELECTION_ID,
+    )
+
+    assert enriched[0]["party_name"] == "Unknown"
+    assert enriched[0]["party_short_name"] == "UNK"
+    assert enriched[0]["constituency_name"] == "Unknown"
+
+
+def test_enrich_candidates_batch_skips_enriched(service, engine):
+    """Already enriched candidates are returned without querying."""
+    candidates = [{"id": "1", "party_name": "Alpha Party", "constituency_name": "X"}]
+    statements = _record_statements(engine)
+
+    assert service.enrich_candidates_batch(candidates, ELECTION_ID) == candidates
+    assert statements == []
+
+
+def test_parties_with_seats(service, engine):
+    """Seats won come from one GROUP BY; parties without wins report 0."""
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add_all(
+            Candidate(
+                id=str(i),
+                name=f"Candidate {i}",
+                party_id=party_id,
+                constituency_id="C1",
+                state_id="S04",
+                status=status,
+            )
+            for i, (party_id, status) in enumerate(
+                [
+                    ("P1", "WON"),
+                    ("P2", "WON"),
+                    ("P2", "WON"),
+                    ("P2", "LOST"),
+                    ("P3", "LOST"),
+                ]
+            )
+        )
+        session.commit()
+    service.get_election(ELECTION_ID)  # cached, so only the seats query is left
+    statements = _record_statements(engine)
+
+    parties = service.get_parties_with_seats(ELECTION_ID)
+
+    assert len(statements) == 1
+    assert [(p["id"], p["seats_won"]) for p in parties] == [
+        ("P2", 2),
+        ("P1", 1),
+        ("P3", 0),
+    ]
+    assert parties[0] == {
+        "id": "P2",
+        "name": "Beta Party",
+        "short_name": "BP",
+        "symbol": "Tree",
+        "seats_won": 2,
+    }
+
+
+def test_parties_with_seats_unknown_election(service):
+    """An unknown election has no parties."""
+    assert service.get_parties_with_seats("nope") == []
@@ -0,0 +1,95 @@
+"""
+Tests for PartyController.get_party_performance.
+"""
+
+import sys
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+# Mock chromadb before importing to avoid numpy compatibility issues in tests
+sys.modules['chromadb'] = MagicMock()
+sys.modules['chromadb.config'] = MagicMock()
+
+from app.controllers.party_controller import PartyController
+
+
+@pytest.fixture
+def data_service():
+    """Stub data service with one election and one party."""
+    service = Mock()
+    service.get_election.return_value = {
+        "id": "lok-sabha-2024",
+        "name": "Lok Sabha 2024",
+    }
+    service.get_party_by_name.return_value = {
+        "id": "P1",
+        "name": "Example Party",
+        "short_name": "EP",
+    }
+    return service
+
+
+@pytest.fixture
+def controller(data_service):
+    """PartyController backed by the stub data service."""
+    controller = PartyController()
+    controller.data_service = data_service
+    return controller
+
+
+def test_party_performance_per_state(controller, data_service):
+    """Totals, seats and win percentages are tallied per state."""
+    data_service.get_candidates_iter.return_value = iter(
+        [
+            {"state_name": "Delhi", "status": "WON"},
+            {"state_name": "Delhi", "status": "LOST"},
+            {"state_name": "Delhi", "status": "WON"},
+            {"state_name": "Bihar", "status": "LOST"},
+            {"state_name": "Kerala", "status": "WON"},
+            {"status": "LOST"},
+        ]
+    )
+
+    result = controller.get_party_performance("Example Party", "lok-sabha-2024")
+
+    data_service.get_candidates_iter.assert_called_once_with(
+        "lok-sabha-2024", party_id="P1"
+    )
+    assert result["total_candidates"] == 6
+    assert result["seats_won"] == 3
+    assert result["win_percentage"] == 50.0
+    states = {s["state_name"]: s for s in result["state_wise_performance"]}
+    assert states["Delhi"] == {
+        "state_name": "Delhi",
+        "total_candidates": 3,
+        "seats_won": 2,
+        "win_percentage": 66.67,
+    }
+    assert states["Bihar"]["win_percentage"] == 0.0
+    assert states["Kerala"]["win_percentage"] == 100.0
+    assert states["Unknown"]["total_candidates"] == 1
+    # Sorted by seats won
+    assert result["state_wise_performance"][0]["state_name"] == "Delhi"
+
+
+def test_party_performance_without_candidates(controller, data_service):
+    """A party with no candidates reports zero totals and percentages."""
+    data_service.get_candidates_iter.return_value = iter([])
+
+    result = controller.get_party_performance("Example Party", "lok-sabha-2024")
+
+    assert result["total_candidates"] == 0
+    assert result["seats_won"] == 0
+    assert result["win_percentage"] == 0
+    assert result["state_wise_performance"] == []
+
+
+def test_party_performance_unknown_party(controller, data_service):
+    """An unknown party has no performance data."""
+    data_service.get_party_by_name.return_value = None
+
+    result = controller.get_party_performance("Nobody", "lok-sabha-2024")
+
+    assert result == {"party_name": "Nobody", "performance": None}
+    data_service.get_candidates_iter.assert_not_called()